@@ -0,0 +1,58 @@
+# benchmarks/bench_graph_setup.py
+#
+# Per-request graph setup cost: building + compiling the StateGraph on every
+# request (the old run_pricing_agent behaviour) versus fetching the shared
+# compiled graph from the registry.
+#
+#   python benchmarks/bench_graph_setup.py --requests 500
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.agent.workflow import create_pricing_agent, get_pricing_agent, clear_agent_registry
+
+
+def measure(fn, n: int) -> list:
+    timings = []
+    for _ in range(n):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label: str, timings: list):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label:<28} mean={statistics.mean(timings):9.4f} ms   "
+          f"p50={statistics.median(timings):9.4f} ms   p95={p95:9.4f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pricing graph setup cost per request")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    clear_agent_registry()
+
+    before = measure(create_pricing_agent, args.requests)
+
+    start = time.perf_counter()
+    get_pricing_agent()
+    first_compile_ms = (time.perf_counter() - start) * 1000
+    after = measure(get_pricing_agent, args.requests)
+
+    print(f"requests: {args.requests}")
+    report("before (compile per request)", before)
+    report("after  (shared registry)", after)
+    print(f"one-time compile at startup: {first_compile_ms:.4f} ms")
+    print(f"speedup: {statistics.mean(before) / max(statistics.mean(after), 1e-9):,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# benchmarks/bench_html_extraction.py
+#
+# Product page extraction: html.parser (BeautifulSoup) vs lxml backends over
+# the saved fixtures in benchmarks/fixtures/html/<domain>.html. Pages are
+# padded with review markup to --page-kb to look like real 1-2 MB listings.
+# Each backend runs in a fresh subprocess so peak RSS is measured per backend.
+#
+#   python benchmarks/bench_html_extraction.py --page-kb 1500 --repeat 10
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import subprocess
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "html")
+
+REVIEW_BLOCK = (
+    '<div class="review"><div class="a-row"><span class="a-profile-name">Customer {i}</span>'
+    '<i class="a-icon-star"><span>4.0 out of 5 stars</span></i></div>'
+    '<span class="review-text">Good product, keeps water cold and the steel finish looks premium. '
+    'Worth the price for daily office use. Review number {i}.</span>'
+    '<script>window.reviewMeta = window.reviewMeta || []; window.reviewMeta.push({i});</script></div>\n'
+)
+
+
+def load_fixtures(page_kb: int) -> dict:
+    pages = {}
+    for filename in sorted(os.listdir(FIXTURE_DIR)):
+        if not filename.endswith(".html"):
+            continue
+        domain = filename[:-len(".html")]
+        with open(os.path.join(FIXTURE_DIR, filename), encoding="utf-8") as f:
+            html = f.read()
+
+        padding = []
+        size, i = len(html), 0
+        while size < page_kb * 1024:
+            block = REVIEW_BLOCK.format(i=i)
+            padding.append(block)
+            size += len(block)
+            i += 1
+        html = html.replace("</body>", "".join(padding) + "</body>")
+        pages[f"https://www.{domain}/product"] = html
+    return pages
+
+
+def run_worker(backend_name: str, page_kb: int, repeat: int):
+    from src.tools.extraction import create_backend, extract_product_data
+
+    pages = load_fixtures(page_kb)
+    backend = create_backend(backend_name)
+
+    timings = {}
+    results = {}
+    for url, html in pages.items():
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results[url] = extract_product_data(html, url, backend=backend)
+            samples.append((time.perf_counter() - start) * 1000)
+        timings[url] = sorted(samples)[len(samples) // 2]
+
+    # separate traced pass: tracemalloc slows allocation-heavy parsers a lot
+    tracemalloc.start()
+    for url, html in pages.items():
+        extract_product_data(html, url, backend=backend)
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(json.dumps({
+        "backend": backend_name,
+        "median_ms": timings,
+        "python_heap_peak_mb": round(traced_peak / 2**20, 2),
+        # ru_maxrss is KiB on Linux; covers C allocations tracemalloc misses
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 2),
+        "results": results
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML extraction backend benchmark")
+    parser.add_argument("--page-kb", type=int, default=1500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--backends", default="html.parser,lxml")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.page_kb, args.repeat)
+        return
+
+    reports = []
+    for backend in args.backends.split(","):
+        out = subprocess.run(
+            [sys.executable, __file__, "--worker", backend,
+             "--page-kb", str(args.page_kb), "--repeat", str(args.repeat)],
+            check=True, capture_output=True, text=True
+        )
+        reports.append(json.loads(out.stdout))
+
+    print(f"page size ~{args.page_kb} KB, median of {args.repeat} runs per page\n")
+    for report in reports:
+        total = sum(report["median_ms"].values())
+        print(f"{report['backend']:<12} total={total:9.2f} ms   "
+              f"python heap peak={report['python_heap_peak_mb']:8.2f} MB   "
+              f"peak RSS={report['peak_rss_mb']:8.2f} MB")
+        for url, ms in report["median_ms"].items():
+            print(f"    {url:<40} {ms:9.2f} ms")
+
+    baseline = reports[0]["results"]
+    for report in reports[1:]:
+        status = "identical" if report["results"] == baseline else "DIFFERENT"
+        print(f"\n{report['backend']} output vs {reports[0]['backend']}: {status}")
+
+
+if __name__ == "__main__":
+    main()
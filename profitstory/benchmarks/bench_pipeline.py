@@ -0,0 +1,291 @@
+# benchmarks/bench_pipeline.py
+#
+# Offline end-to-end benchmark of run_pricing_agent. Nothing leaves the
+# machine:
+#   - search      a fake backend returning amazon.in / flipkart.com /
+#                 myntra.com product URLs for every query
+#   - pages       a local HTTP server serving benchmarks/fixtures/html/<domain>.html
+#                 (plus robots.txt and ETags); the scrape engine's httpx
+#                 transport routes every host to it, so URLs, extraction
+#                 rules and per-domain rate limiting see the real domains
+#   - LLM         the deterministic FakeLLM
+#   - sentiment   a keyword stand-in for the DistilBERT pipeline
+#
+# Reports p50/p95/p99 per node and end to end, throughput and peak RSS, and
+# writes them to a JSON file so runs can be compared across commits.
+#
+#   python benchmarks/bench_pipeline.py --runs 200 --concurrency 4 --output bench_pipeline.json
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import resource
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Benchmarks never touch the user's disk caches
+for _env in ("SEARCH_CACHE_PATH", "ROBOTS_CACHE_PATH", "PAGE_CACHE_PATH", "RUN_STORE_PATH", "MARKETING_CACHE_PATH"):
+    os.environ[_env] = ""
+os.environ["CHECKPOINT_PATH"] = os.path.join(tempfile.gettempdir(), "profitstory-bench-checkpoints.sqlite")
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.bench_html_extraction import load_fixtures
+from src.agent.workflow import run_pricing_agent, get_pricing_agent
+from src.tools.cache import clear_caches
+from src.tools.extraction import extract_product_data
+from src.tools.llm import use_fake_llm
+from src.tools.scrape_engine import AsyncScrapeEngine, DomainRateLimiter
+from src.tools.scraper import PAGE_CACHE, set_scrape_engine
+from src.tools.search import set_search_backend
+from src.tools.sentiment import get_sentiment_manager
+
+QUERIES = [
+    "stainless steel insulated water bottle",
+    "handcrafted genuine leather tote bag premium",
+    "organic cotton handloom saree",
+    "wireless noise cancelling headphones",
+    "artisan ceramic coffee mug set",
+    "bamboo toothbrush eco friendly pack",
+    "premium silk scarf hand embroidered",
+    "ergonomic office chair with lumbar support",
+]
+
+REVIEW_SNIPPETS = [
+    "Love it, the quality is excellent and worth the price.",
+    "Good product but delivery was slow. Wish it had a bigger size.",
+    "Terrible finish, broke after a week. Overpriced for what you get.",
+    "Handcrafted feel, premium material, a perfect gift for Diwali.",
+    "Decent value for money, would be great if it came in more colours.",
+]
+
+PERCENTILES = (50, 95, 99)
+
+
+# ---------------- LOCAL STAND-INS ----------------
+
+class FixtureServer:
+    """Serves fixture pages by Host header, with robots.txt and ETag revalidation."""
+
+    def __init__(self, page_kb: int):
+        pages = load_fixtures(page_kb)
+        # "https://www.amazon.in/product" -> "amazon.in"
+        self.pages = {url.split("/")[2][len("www."):]: html.encode("utf-8") for url, html in pages.items()}
+        self.domains = sorted(self.pages)
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.requests += 1
+                host = self.headers.get("Host", "").split(":")[0]
+                domain = host[len("www."):] if host.startswith("www.") else host
+
+                if self.path == "/robots.txt":
+                    return self._send(200, b"User-agent: *\nAllow: /\n", "text/plain")
+                body = server.pages.get(domain)
+                if body is None:
+                    return self._send(404, b"not found", "text/plain")
+
+                etag = f'"{domain}-{len(body)}"'
+                if self.headers.get("If-None-Match") == etag:
+                    return self._send(304, b"", "text/html", etag)
+                return self._send(200, body, "text/html; charset=utf-8", etag)
+
+            def _send(self, status, body, content_type, etag=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if etag:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.port = self.httpd.server_address[1]
+        threading.Thread(target=self.httpd.serve_forever, name="fixture-server", daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+
+
+def local_transport(port: int):
+    """httpx transport sending every request to the fixture server, Host header untouched."""
+    import httpx
+
+    class LocalTransport(httpx.AsyncBaseTransport):
+        def __init__(self):
+            self._inner = httpx.AsyncHTTPTransport()
+
+        async def handle_async_request(self, request):
+            request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=port)
+            return await self._inner.handle_async_request(request)
+
+        async def aclose(self):
+            await self._inner.aclose()
+
+    return LocalTransport()
+
+
+class FixtureSearchBackend:
+    """Product URLs on the fixture domains, with review-like snippets."""
+
+    def __init__(self, domains: list):
+        self.domains = domains
+
+    def search(self, query: str, top_k: int, domains: list) -> dict:
+        slug = "-".join(query.split(" site:")[0].split())
+        hits = [d for d in self.domains if d in (domains or self.domains)]
+        return {"results": [
+            {
+                "title": f"{query} - {domain}",
+                "url": f"https://www.{domain}/dp/{slug}",
+                "content": REVIEW_SNIPPETS[(i + len(query)) % len(REVIEW_SNIPPETS)],
+            }
+            for i, domain in enumerate(hits[:top_k])
+        ]}
+
+
+def fake_sentiment(texts, **kwargs):
+    negative = ("terrible", "broke", "overpriced", "slow")
+    return [
+        {"label": "NEGATIVE" if any(w in t.lower() for w in negative) else "POSITIVE", "score": 0.99}
+        for t in texts
+    ]
+
+
+def install_stand_ins(server: FixtureServer, polite: bool):
+    set_search_backend(FixtureSearchBackend(server.domains))
+    use_fake_llm()
+    get_sentiment_manager().set_pipeline(fake_sentiment)
+    # Real politeness would make the benchmark measure the 1.5 s spacing
+    limiter = DomainRateLimiter() if polite else DomainRateLimiter(politeness={}, default=(1e6, 1000))
+    set_scrape_engine(AsyncScrapeEngine(
+        extract=extract_product_data, limiter=limiter, page_cache=PAGE_CACHE,
+        transport=local_transport(server.port)
+    ))
+
+
+# ---------------- MEASUREMENT ----------------
+
+def percentile(sorted_values: list, p: float) -> float:
+    """Nearest-rank percentile."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(samples: list) -> dict:
+    values = sorted(samples)
+    summary = {f"p{p}": round(percentile(values, p), 2) for p in PERCENTILES}
+    summary["mean"] = round(sum(values) / len(values), 2) if values else 0.0
+    summary["max"] = round(values[-1], 2) if values else 0.0
+    return summary
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_benchmark(runs: int, concurrency: int, cold: bool, warmup: int, durable: bool = False,
+                  memo: bool = True) -> dict:
+    agent = get_pricing_agent(durable=durable)
+
+    def one(i: int) -> dict:
+        query = QUERIES[i % len(QUERIES)]
+        start = time.perf_counter()
+        result = run_pricing_agent(query, query, 0, "", agent=agent, memo=memo)
+        result["timings"]["wall_ms"] = (time.perf_counter() - start) * 1000
+        return result
+
+    for i in range(warmup):
+        one(i)
+
+    node_samples, e2e, prices = {}, [], []
+    lock = threading.Lock()
+
+    def measured(i: int):
+        if cold:
+            clear_caches()
+        result = one(i)
+        with lock:
+            for node, ms in result["timings"]["nodes_ms"].items():
+                node_samples.setdefault(node, []).append(ms)
+            e2e.append(result["timings"]["wall_ms"])
+            prices.append(result["suggested_price"])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(measured, range(runs)))
+    wall_s = time.perf_counter() - start
+
+    return {
+        "nodes_ms": {node: summarize(samples) for node, samples in node_samples.items()},
+        "end_to_end_ms": summarize(e2e),
+        "throughput_runs_per_s": round(runs / wall_s, 2),
+        "wall_s": round(wall_s, 3),
+        "priced": sum(1 for p in prices if p),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end pricing pipeline benchmark")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--page-kb", type=int, default=0, help="pad fixture pages to this size")
+    parser.add_argument("--cold", action="store_true", help="clear every cache before each run")
+    parser.add_argument("--polite", action="store_true", help="keep the real per-domain rate limits")
+    parser.add_argument("--durable", action="store_true", help="checkpoint every node to SQLite")
+    parser.add_argument("--no-memo", action="store_true", help="execute every node instead of replaying memoized ones")
+    parser.add_argument("--output", default="bench_pipeline.json")
+    args = parser.parse_args()
+
+    server = FixtureServer(args.page_kb)
+    try:
+        install_stand_ins(server, args.polite)
+        results = run_benchmark(args.runs, args.concurrency, args.cold, args.warmup, args.durable,
+                                not args.no_memo)
+    finally:
+        server.close()
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "config": vars(args),
+        **results,
+        "fixture_requests": server.requests,
+        # ru_maxrss is KiB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 2),
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{args.runs} runs, concurrency {args.concurrency}, "
+          f"{'cold' if args.cold else 'warm'} caches  (commit {report['commit']})\n")
+    print(f"{'node':<22}" + "".join(f"{'p' + str(p):>10}" for p in PERCENTILES) + f"{'mean':>10}")
+    for node, s in list(results["nodes_ms"].items()) + [("end_to_end", results["end_to_end_ms"])]:
+        print(f"{node:<22}" + "".join(f"{s['p' + str(p)]:>10.2f}" for p in PERCENTILES) + f"{s['mean']:>10.2f}")
+    print(f"\nthroughput {results['throughput_runs_per_s']} runs/s   peak RSS {report['peak_rss_mb']} MB")
+    print(f"written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
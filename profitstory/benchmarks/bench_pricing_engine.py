@@ -0,0 +1,183 @@
+# benchmarks/bench_pricing_engine.py
+#
+# Whole-catalogue repricing: the original scalar pricing engine, one product
+# at a time, vs one vectorized price_catalogue() pass over synthetic cached
+# signals. The scalar code is kept here verbatim (pricing_engine_tool now
+# wraps the vectorized engine) as the baseline and as the parity reference.
+#
+#   python benchmarks/bench_pricing_engine.py --skus 1000000 [--paise]
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.tools.pricing_engine import price_catalogue, to_records
+
+
+def scalar_pricing_engine(input: dict) -> dict:
+    """pricing_engine_tool as it was before vectorization."""
+    market_baseline = input.get("market_baseline", 500)
+    experience = input.get("experience_score", 50)
+    trend = input.get("trend_boost_score", 10)
+    competitor_prices = input.get("competitor_prices", [])
+    brand_strength = input.get("brand_strength", 0)
+    craftsmanship = input.get("craftsmanship_score", 0)
+
+    if competitor_prices:
+        competitor_avg = statistics.mean(competitor_prices)
+        competitor_adjustment = competitor_avg * 0.12
+        baseline = competitor_avg
+    else:
+        competitor_adjustment = 0
+        if market_baseline <= 0:
+            baseline = 999
+        else:
+            baseline = market_baseline
+
+    experience_premium = (experience / 100) * (baseline * 0.4)
+    brand_bonus = (brand_strength / 100) * (baseline * 0.25)
+    craftsmanship_bonus = craftsmanship * 10
+    trend_boost = (trend / 100) * (baseline * 0.25)
+
+    pre_multiplier_price = (
+        baseline
+        + experience_premium
+        + trend_boost
+        + competitor_adjustment
+        + brand_bonus
+        + craftsmanship_bonus
+    )
+
+    if experience < 40:
+        multiplier = 3
+    elif experience < 70:
+        multiplier = 5
+    elif experience < 90:
+        multiplier = 7
+    else:
+        multiplier = 10
+    multiplier = min(multiplier, 10)
+
+    final_price = int(pre_multiplier_price * multiplier)
+
+    score = 0
+    if len(competitor_prices) >= 3:
+        score += 40
+    elif len(competitor_prices) >= 1:
+        score += 25
+    else:
+        score += 10
+
+    if experience >= 70:
+        score += 30
+    elif experience >= 50:
+        score += 20
+    else:
+        score += 10
+
+    if trend >= 50:
+        score += 20
+    elif trend >= 20:
+        score += 10
+    else:
+        score += 5
+
+    if brand_strength >= 60:
+        score += 10
+    elif brand_strength >= 20:
+        score += 5
+
+    if score >= 80:
+        confidence_level = "high"
+    elif score >= 50:
+        confidence_level = "medium"
+    else:
+        confidence_level = "low"
+
+    if competitor_prices:
+        avg = statistics.mean(competitor_prices)
+        if final_price < avg * 0.9:
+            price_position = "below_market"
+        elif final_price > avg * 1.2:
+            price_position = "above_market"
+        else:
+            price_position = "competitive"
+    else:
+        price_position = "estimated"
+
+    return {
+        "suggested_price": final_price,
+        "market_baseline": baseline,
+        "experience_premium": round(experience_premium, 2),
+        "trend_boost": round(trend_boost, 2),
+        "competitor_adjustment": round(competitor_adjustment, 2),
+        "brand_bonus": round(brand_bonus, 2),
+        "craftsmanship_bonus": craftsmanship_bonus,
+        "dynamic_multiplier": multiplier,
+        "pre_multiplier_price": int(pre_multiplier_price),
+        "confidence_level": confidence_level,
+        "price_position": price_position
+    }
+
+
+def synthetic_catalogue(skus: int, seed: int = 0, paise: bool = False) -> dict:
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(0, 7, skus)
+    competitor_prices = rng.integers(100, 9000, counts.sum()).astype(float)
+    if paise:
+        # scraped prices often carry paise, which takes the exact-mean path
+        competitor_prices += rng.integers(0, 100, counts.sum()) / 100
+    return {
+        "market_baseline": rng.integers(0, 5000, skus).astype(float),
+        "experience_score": rng.uniform(0, 100, skus),
+        "trend_boost_score": rng.uniform(0, 100, skus),
+        "brand_strength": rng.uniform(0, 100, skus),
+        "craftsmanship_score": rng.integers(0, 10, skus).astype(float),
+        "competitor_prices": competitor_prices,
+        "competitor_counts": counts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorized pricing engine benchmark")
+    parser.add_argument("--skus", type=int, default=1_000_000)
+    parser.add_argument("--scalar-sample", type=int, default=2000,
+                        help="products priced by the scalar engine to extrapolate its cost")
+    parser.add_argument("--paise", action="store_true", help="fractional competitor prices (e.g. 1299.99)")
+    args = parser.parse_args()
+
+    catalogue = synthetic_catalogue(args.skus, paise=args.paise)
+
+    start = time.perf_counter()
+    result = price_catalogue(**catalogue)
+    vector_s = time.perf_counter() - start
+
+    # original scalar engine on a sample, checked against the vectorized result
+    sample = min(args.scalar_sample, args.skus)
+    offsets = np.concatenate(([0], np.cumsum(catalogue["competitor_counts"])))
+    records = to_records({name: col[:sample] for name, col in result.items()})
+
+    start = time.perf_counter()
+    mismatches = 0
+    for i in range(sample):
+        row = {name: catalogue[name][i].item() for name in (
+            "market_baseline", "experience_score", "trend_boost_score",
+            "brand_strength", "craftsmanship_score")}
+        row["competitor_prices"] = catalogue["competitor_prices"][offsets[i]:offsets[i + 1]].tolist()
+        if scalar_pricing_engine(row) != records[i]:
+            mismatches += 1
+    scalar_s = (time.perf_counter() - start) / sample * args.skus
+
+    print(f"{args.skus} SKUs, {'fractional' if args.paise else 'whole-rupee'} competitor prices")
+    print(f"  vectorized pass        {vector_s:10.3f} s")
+    print(f"  scalar engine          {scalar_s:10.3f} s (extrapolated from {sample})")
+    print(f"  sample mismatches      {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# benchmarks/bench_startup.py
+#
+# Cold-start import cost of the entry points, measured with
+# `python -X importtime` in fresh interpreters, plus a check that heavy
+# optional dependencies stay unloaded until first use. Exits non-zero when
+# a module loads something it must not.
+#
+#   python benchmarks/bench_startup.py --repeat 5 --output bench_startup.json
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Loaded lazily by the tools on first use; importing an entry point must not pull them in
+HEAVY = ("torch", "transformers", "tavily", "bs4", "soupsieve", "lxml",
+         "langchain_google_genai", "google.generativeai", "selenium")
+
+# entry point -> modules it must not import (on top of HEAVY)
+TARGETS = {
+    "src.agent.workflow": (),
+    "src.api.main": (),
+    "src.cli.reprice": ("langchain_core", "langgraph", "httpx", "requests"),
+    "src.agent.simulation": ("langchain_core", "langgraph", "httpx", "requests"),
+}
+
+
+def import_profile(module: str) -> dict:
+    """Cumulative import time (ms) of `module` and of each module it imports directly."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    total, direct, children = None, {}, {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue                # header line
+        ms = int(cumulative) / 1000
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        # importtime prints children before their parent
+        if depth == 1:
+            children[name.strip()] = ms
+        elif depth == 0:
+            if name.strip() == module:
+                total, direct = ms, children
+            children = {}
+    return {"total_ms": total, "direct_imports_ms": direct}
+
+
+def loaded_modules(module: str) -> list:
+    code = f"import sys, json, {module}; print(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Entry point import-time benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--targets", default=",".join(TARGETS))
+    parser.add_argument("--top", type=int, default=8, help="slowest direct imports to list")
+    parser.add_argument("--output", help="write the report as JSON")
+    args = parser.parse_args()
+
+    report, violations = {}, []
+    for module in args.targets.split(","):
+        profiles = [import_profile(module) for _ in range(args.repeat)]
+        last = profiles[-1]["direct_imports_ms"]
+        slowest = sorted(last.items(), key=lambda item: item[1], reverse=True)[:args.top]
+
+        forbidden = HEAVY + TARGETS.get(module, ())
+        loaded = loaded_modules(module)
+        unexpected = sorted({
+            name for name in forbidden
+            if any(m == name or m.startswith(name + ".") for m in loaded)
+        })
+        violations.extend(f"{module} imports {name}" for name in unexpected)
+
+        totals = [p["total_ms"] for p in profiles]
+        report[module] = {
+            "median_ms": round(statistics.median(totals), 1),
+            "min_ms": round(min(totals), 1),
+            "modules_loaded": len(loaded),
+            "slowest_direct_imports_ms": dict(slowest),
+            "forbidden_loaded": unexpected,
+        }
+
+        print(f"{module:<22} median {report[module]['median_ms']:8.1f} ms   "
+              f"min {report[module]['min_ms']:8.1f} ms   {len(loaded)} modules")
+        for name, ms in slowest:
+            print(f"    {name:<40} {ms:8.1f} ms")
+        if unexpected:
+            print(f"    !! loads {', '.join(unexpected)}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if violations:
+        print("\n" + "\n".join(violations))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# src/agent/runs.py
+#
+# Stored runs, the pricing inputs derived from them and the final output
+# compiled from them. Kept apart from workflow.py, and free of
+# LangChain/LangGraph imports, so pricing-only workers (simulation,
+# src/cli/reprice.py) start without loading the graph.
+
+import os
+
+from src.tools.cache import TieredCache, cache_path
+
+
+# ---------------- RUN STORE ----------------
+# Upstream signals of finished runs, keyed by run_id, so the pricing stage
+# can be re-evaluated (what-if simulation) without search, scraping or LLM
+# calls. These are the only state keys calculate_pricing and compile_output
+# read.
+
+RUN_SIGNAL_KEYS = (
+    "product_query", "product_name", "initial_price_inr", "product_data",
+    "competitor_data", "experience_score", "trend_insights",
+    "marketing_justification",
+)
+
+RUN_STORE = TieredCache(
+    "runs",
+    maxsize=int(os.getenv("RUN_STORE_SIZE", "1024")),
+    ttl=float(os.getenv("RUN_STORE_TTL", str(7 * 24 * 3600))),
+    path=cache_path("RUN_STORE_PATH", "runs.sqlite")
+)
+
+
+def save_run_signals(run_id: str, state: dict):
+    RUN_STORE.set(run_id, {key: state.get(key) for key in RUN_SIGNAL_KEYS})
+
+
+def load_run_signals(run_id: str):
+    """Stored signals for run_id, or None when unknown or expired."""
+    return RUN_STORE.get(run_id)
+
+
+def build_pricing_inputs(state: dict) -> dict:
+    """Pricing engine inputs derived from the upstream signals in the state."""
+
+    cd = state["competitor_data"]
+    es = state["experience_score"]
+    ti = state["trend_insights"]
+
+    baseline = cd.get("price_range", {}).get("avg") or state["initial_price_inr"] or 500
+
+    competitor_prices = [c.get("price", baseline) for c in cd.get("competitors", [])]
+
+    return {
+        "market_baseline": baseline,
+        "experience_score": es.get("experience_score", 50),
+        "trend_boost_score": ti.get("trend_boost_score", 0),
+        "competitor_prices": competitor_prices,
+        "brand_strength": es.get("brand_strength", 30),
+        "craftsmanship_score": es.get("craftsmanship_score", 20)
+    }
+
+
+# ---------------- OUTPUT ----------------
+# The graph's last node; pure, so simulation reuses it without the graph.
+
+def compile_output_node(state: dict) -> dict:
+
+    final = {
+        "product_title": state["product_data"].get("title"),
+        "brand": state["product_data"].get("brand"),
+        "rewritten_description": state["product_data"].get("rewritten_description"),
+        "competitor_prices": state["competitor_data"].get("competitors", []),
+        "experience_score": state["experience_score"].get("experience_score"),
+        "trend_insights": state["trend_insights"].get("trends_detected", []),
+        "pricing_result": state["pricing_result"],
+        "suggested_price": state["pricing_result"].get("suggested_price"),
+        "marketing_justification": state["marketing_justification"],
+    }
+
+    return {"final_output": final}
@@ -0,0 +1,108 @@
+# src/agent/simulation.py
+#
+# What-if pricing: re-evaluate only the pricing stage (calculate_pricing +
+# compile_output) of a stored run with some inputs overridden. No search,
+# scraping or LLM calls are made; the marketing copy is the one from the
+# original run.
+
+import itertools
+import os
+import numpy as np
+
+from src.agent.runs import build_pricing_inputs, compile_output_node, load_run_signals, RUN_SIGNAL_KEYS
+from src.tools.pricing_engine import price_catalogue, price_products, to_records
+
+# Pricing inputs that can be overridden; all but competitor_prices can be swept
+OVERRIDABLE_INPUTS = (
+    "market_baseline", "experience_score", "trend_boost_score",
+    "competitor_prices", "brand_strength", "craftsmanship_score",
+)
+SWEEPABLE_INPUTS = tuple(name for name in OVERRIDABLE_INPUTS if name != "competitor_prices")
+
+SIMULATE_MAX_POINTS = int(os.getenv("SIMULATE_MAX_POINTS", "10000"))
+
+
+class UnknownRunError(KeyError):
+    pass
+
+
+def resolve_signals(run_id: str = None, signals: dict = None) -> dict:
+    """Upstream signals from the run store, or as supplied by the caller."""
+    if signals is not None:
+        missing = [key for key in RUN_SIGNAL_KEYS if key not in signals]
+        if missing:
+            raise ValueError(f"signals missing: {', '.join(missing)}")
+        return signals
+
+    stored = load_run_signals(run_id) if run_id else None
+    if stored is None:
+        raise UnknownRunError(run_id)
+    return stored
+
+
+def _check_names(names, allowed: tuple, what: str):
+    unknown = sorted(set(names) - set(allowed))
+    if unknown:
+        raise ValueError(f"cannot {what}: {', '.join(unknown)} (allowed: {', '.join(allowed)})")
+
+
+def simulate_pricing(run_id: str = None, signals: dict = None,
+                     overrides: dict = None, sweep: dict = None) -> dict:
+    """
+    Re-price a run with `overrides` applied to the pricing inputs.
+
+    `sweep` maps input names to lists of values; every combination (on top
+    of the overrides) is priced in one vectorized pass.
+    """
+    overrides = overrides or {}
+    sweep = sweep or {}
+    _check_names(overrides, OVERRIDABLE_INPUTS, "override")
+    _check_names(sweep, SWEEPABLE_INPUTS, "sweep")
+
+    state = resolve_signals(run_id, signals)
+    inputs = {**build_pricing_inputs(state), **overrides}
+
+    pricing_result = price_products([inputs])[0]
+    output_state = {**state, "pricing_result": pricing_result}
+    if "experience_score" in overrides:
+        # report the score the price was computed from, not the stored one
+        output_state["experience_score"] = {
+            **(state.get("experience_score") or {}), "experience_score": overrides["experience_score"]
+        }
+    final_output = compile_output_node(output_state)["final_output"]
+
+    return {
+        "run_id": run_id,
+        "inputs": inputs,
+        "final_output": final_output,
+        "sweep": sweep_pricing(inputs, sweep) if sweep else [],
+    }
+
+
+def sweep_pricing(inputs: dict, sweep: dict) -> list:
+    """Price the cartesian product of the swept values, other inputs fixed."""
+    names = list(sweep)
+    grid = list(itertools.product(*(sweep[name] for name in names)))
+    if len(grid) > SIMULATE_MAX_POINTS:
+        raise ValueError(f"sweep has {len(grid)} points, at most {SIMULATE_MAX_POINTS} allowed")
+
+    size = len(grid)
+    columns = {
+        name: np.full(size, inputs[name], dtype=np.float64)
+        for name in SWEEPABLE_INPUTS
+    }
+    for position, name in enumerate(names):
+        columns[name] = np.array([point[position] for point in grid], dtype=np.float64)
+
+    competitor_prices = np.asarray(inputs.get("competitor_prices") or [], dtype=np.float64)
+    result = price_catalogue(
+        **columns,
+        competitor_prices=np.tile(competitor_prices, size),
+        competitor_counts=np.full(size, competitor_prices.size),
+        size=size
+    )
+
+    return [
+        {"params": dict(zip(names, point)), **record}
+        for point, record in zip(grid, to_records(result))
+    ]
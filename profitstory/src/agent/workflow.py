@@ -7,6 +7,11 @@ from langgraph.graph.message import add_messages
 import os
 import sys
 import json
+import copy
+import uuid
+import time
+import threading
+from datetime import date
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -23,15 +28,33 @@ from src.tools.trends import trend_intelligence_tool          # expects { "input
 from src.tools.experience import experience_score_generator_tool  # expects direct args (NO input)
 from src.tools.pricing import pricing_engine_tool             # expects { "input": {...} }
 from src.tools.marketing import marketing_justification_tool  # expects { "input": {...} }
+from src.agent.runs import build_pricing_inputs, compile_output_node, save_run_signals, load_run_signals, RUN_SIGNAL_KEYS
+from src.tools.cache import TieredCache, cache_path, make_cache_key, CACHE_PURGE_INTERVAL_S
+from src.observability.metrics import observe_node, observe_memo
 
 
 # ---------------- STATE ----------------
+# Nodes return only the keys they own instead of the whole state. The four
+# analysis branches run in the same superstep, and LangGraph merges their
+# partial updates; since no two branches write the same key, the merge is
+# safe without extra reducers. The shared keys, `timings` and `memo_hits`,
+# merge.
+
+def merge_timings(left: dict, right: dict) -> dict:
+    return {**(left or {}), **(right or {})}
+
+
+def merge_memo_hits(left: list, right: list) -> list:
+    return sorted(set(left or ()) | set(right or ()))
+
+
 class PricingAgentState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], add_messages]
     product_query: str
     product_name: str
     initial_price_inr: float
     supplied_description: str
+    current_date: str                           # YYYY-MM-DD, the date trends are detected for
     search_results: dict
     product_data: dict
     narrative_analysis: dict
@@ -43,21 +66,23 @@ class PricingAgentState(TypedDict):
     marketing_justification: dict
     final_output: dict
     current_step: str
+    timings: Annotated[dict, merge_timings]     # node -> milliseconds
+    memo_hits: Annotated[list, merge_memo_hits]  # nodes answered from NODE_MEMO
 
 
 # ---------------- NODES ----------------
 
-def search_product_node(state: PricingAgentState) -> PricingAgentState:
-    state["search_results"] = web_search_tool.invoke({
+def search_product_node(state: PricingAgentState) -> dict:
+    search_results = web_search_tool.invoke({
         "input": {
             "query": state["product_query"],
             "top_k": 10
         }
     })
-    return state
+    return {"search_results": search_results}
 
 
-def scrape_product_node(state: PricingAgentState) -> PricingAgentState:
+def scrape_product_node(state: PricingAgentState) -> dict:
 
     results = state["search_results"].get("results", [])
     target_url = None
@@ -72,11 +97,11 @@ def scrape_product_node(state: PricingAgentState) -> PricingAgentState:
         target_url = results[0]["url"]
 
     if target_url:
-        state["product_data"] = legal_web_scraper_tool.invoke({
+        product_data = legal_web_scraper_tool.invoke({
             "input": {"url": target_url}
         })
     else:
-        state["product_data"] = {
+        product_data = {
             "title": state["product_name"],
             "description": state["supplied_description"],
             "brand": "Unknown",
@@ -85,10 +110,10 @@ def scrape_product_node(state: PricingAgentState) -> PricingAgentState:
             "scrape_allowed": False
         }
 
-    return state
+    return {"product_data": product_data}
 
 
-def analyze_narrative_node(state: PricingAgentState) -> PricingAgentState:
+def analyze_narrative_node(state: PricingAgentState) -> dict:
 
     pd = state["product_data"]
 
@@ -97,90 +122,75 @@ def analyze_narrative_node(state: PricingAgentState) -> PricingAgentState:
         state.get("supplied_description", "")
     ]))
 
-    state["narrative_analysis"] = product_narrative_analyzer_tool.invoke({
+    narrative_analysis = product_narrative_analyzer_tool.invoke({
         "title": pd.get("title", state["product_name"]),
         "description": combined_description
     })
 
-    return state
+    return {"narrative_analysis": narrative_analysis}
 
 
-def gather_competitor_data_node(state: PricingAgentState) -> PricingAgentState:
+def gather_competitor_data_node(state: PricingAgentState) -> dict:
 
-    state["competitor_data"] = competitor_pricing_tool.invoke({
+    competitor_data = competitor_pricing_tool.invoke({
         "product_query": state["product_query"],
         "platforms": None
     })
 
-    return state
+    return {"competitor_data": competitor_data}
 
 
-def analyze_reviews_node(state: PricingAgentState) -> PricingAgentState:
+def analyze_reviews_node(state: PricingAgentState) -> dict:
 
     reviews = [r.get("snippet", "") for r in state["search_results"].get("results", [])]
 
-    state["review_insights"] = review_intelligence_tool.invoke({
+    review_insights = review_intelligence_tool.invoke({
         "input": {
             "reviews": reviews,
             "max_reviews": 50
         }
     })
 
-    return state
+    return {"review_insights": review_insights}
 
 
-def detect_trends_node(state: PricingAgentState) -> PricingAgentState:
+def detect_trends_node(state: PricingAgentState) -> dict:
 
-    state["trend_insights"] = trend_intelligence_tool.invoke({
+    trend_insights = trend_intelligence_tool.invoke({
         "input": {
             "product_category": state["product_query"],
-            "current_date": None
+            "current_date": state.get("current_date")
         }
     })
 
-    return state
+    return {"trend_insights": trend_insights}
 
 
-def calculate_experience_score_node(state: PricingAgentState) -> PricingAgentState:
+def calculate_experience_score_node(state: PricingAgentState) -> dict:
     """MOST IMPORTANT FIX: NO `input:` wrapper"""
 
     pd = state["product_data"]
 
-    state["experience_score"] = experience_score_generator_tool.invoke({
+    experience_score = experience_score_generator_tool.invoke({
         "narrative_analysis": state["narrative_analysis"],
         "review_insights": state["review_insights"],
         "brand_name": pd.get("brand", "Unknown"),
         "materials": pd.get("materials", [])
     })
 
-    return state
-
-
-def calculate_pricing_node(state: PricingAgentState) -> PricingAgentState:
-
-    cd = state["competitor_data"]
-    es = state["experience_score"]
-    ti = state["trend_insights"]
+    return {"experience_score": experience_score}
 
-    baseline = cd.get("price_range", {}).get("avg") or state["initial_price_inr"] or 500
 
-    competitor_prices = [c.get("price", baseline) for c in cd.get("competitors", [])]
+def calculate_pricing_node(state: PricingAgentState) -> dict:
 
-    state["pricing_result"] = pricing_engine_tool.invoke({
-        "input": {
-            "market_baseline": baseline,
-            "experience_score": es.get("experience_score", 50),
-            "trend_boost_score": ti.get("trend_boost_score", 0),
-            "competitor_prices": competitor_prices,
-            "brand_strength": es.get("brand_strength", 30),
-            "craftsmanship_score": es.get("craftsmanship_score", 20)
-        }
+    pricing_result = pricing_engine_tool.invoke({
+        "input": build_pricing_inputs(state)
     })
 
-    return state
+    return {"pricing_result": pricing_result}
 
 
-def rewrite_description_node(state: PricingAgentState) -> PricingAgentState:
+def rewrite_description_node(state: PricingAgentState) -> dict:
 
     pd = state["product_data"]
     pr = state["pricing_result"]
@@ -199,75 +209,332 @@ def rewrite_description_node(state: PricingAgentState) -> PricingAgentState:
 
     rewritten = justification.get("marketing_copy") if isinstance(justification, dict) else justification
 
-    state["product_data"]["rewritten_description"] = rewritten
-    state["marketing_justification"] = {"marketing_copy": rewritten}
-
-    return state
-
-
-def compile_output_node(state: PricingAgentState) -> PricingAgentState:
-
-    final = {
-        "product_title": state["product_data"].get("title"),
-        "brand": state["product_data"].get("brand"),
-        "rewritten_description": state["product_data"].get("rewritten_description"),
-        "competitor_prices": state["competitor_data"].get("competitors", []),
-        "experience_score": state["experience_score"].get("experience_score"),
-        "trend_insights": state["trend_insights"].get("trends_detected", []),
-        "pricing_result": state["pricing_result"],
-        "suggested_price": state["pricing_result"].get("suggested_price"),
-        "marketing_justification": state["marketing_justification"],
+    return {
+        "product_data": {**pd, "rewritten_description": rewritten},
+        "marketing_justification": {"marketing_copy": rewritten}
     }
 
-    state["final_output"] = final
-    return state
+
+# ---------------- NODE MEMO ----------------
+# A node's update depends only on the state keys it reads, so it is cached
+# under the values of exactly those keys. The keys are not declared: the
+# node runs against a _ReadTracker that records them, and each distinct read
+# set seen for a node (branches can read different keys) is kept with the
+# entries. A rerun that changes, say, current_date or initial_price_inr then
+# replays the analysis branches from the memo and only executes the nodes
+# whose inputs changed, downstream of the edit.
+#
+# Nodes that reach the network (NETWORK_NODES) are never memoized: they
+# always call their tools, so the search cache (SEARCH_CACHE_TTL plus
+# stale-while-revalidate) and the page cache (ETag/Last-Modified
+# revalidation) decide how fresh prices and page content are, not
+# NODE_MEMO_TTL. A rerun still costs them only cache hits, and the nodes
+# downstream replay whenever the refreshed data came back unchanged.
+#
+# Reads are tracked per top-level key; a node reading one field of
+# product_data is keyed on the whole of product_data. Updates carrying an
+# error or a timeout are not memoized, so a transient failure is retried.
+# NODE_MEMO=0 disables the memo; config["configurable"]["memo"] = False
+# bypasses it for one run.
+
+NODE_MEMO_ENABLED = os.getenv("NODE_MEMO", "1") != "0"
+
+NODE_MEMO = TieredCache(
+    "nodes",
+    maxsize=int(os.getenv("NODE_MEMO_SIZE", "4096")),
+    ttl=float(os.getenv("NODE_MEMO_TTL", "3600")),
+    path=os.getenv("NODE_MEMO_PATH") or None
+)
+
+# Freshness belongs to their tool caches (see above)
+NETWORK_NODES = {"search_product", "scrape_product", "gather_competitors"}
+# Cheaper to rerun than to hash their inputs
+UNMEMOIZED_NODES = {"compile_output"} | NETWORK_NODES
+
+_read_sets_lock = threading.Lock()
+
+
+class _ReadTracker(dict):
+    """State view recording which top-level keys a node reads."""
+
+    def __init__(self, state: dict):
+        super().__init__(state)
+        self.reads = set()
+
+    def __getitem__(self, key):
+        self.reads.add(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.reads.add(key)
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        self.reads.add(key)
+        return super().__contains__(key)
+
+
+def _read_sets_key(name: str) -> str:
+    return make_cache_key("node-reads", name)
+
+
+def _memo_key(name: str, reads: list, state: dict) -> str:
+    return make_cache_key("node", name, [[key, state.get(key)] for key in reads])
+
+
+def _memo_lookup(name: str, state: dict):
+    for reads in NODE_MEMO.get(_read_sets_key(name)) or ():
+        update = NODE_MEMO.get(_memo_key(name, reads, state))
+        if update is not None:
+            return copy.deepcopy(update)
+    return None
+
+
+def _failed_update(update: dict) -> bool:
+    return any(
+        isinstance(value, dict) and (value.get("error") or value.get("timed_out"))
+        for value in update.values()
+    )
+
+
+def _memo_store(name: str, reads: set, state: dict, update: dict):
+    if _failed_update(update):
+        return
+    reads = sorted(reads)
+    with _read_sets_lock:
+        read_sets = NODE_MEMO.get(_read_sets_key(name)) or []
+        if reads not in read_sets:
+            read_sets = read_sets + [reads]
+        # re-set even when known, so the read sets outlive the entries
+        NODE_MEMO.set(_read_sets_key(name), read_sets)
+    NODE_MEMO.set(_memo_key(name, reads, state), copy.deepcopy(update))
+
+
+# ---------------- NODE WRAPPER ----------------
+# Every node runs through _instrumented, which
+#  - checks the caller's cancel token (anything with is_set(), e.g. a
+#    threading.Event, passed as config["configurable"]["cancel_event"]), so
+#    a cancelled or timed-out run stops at the next node boundary;
+#  - records the node's latency (and failures) in the metrics registry and
+#    adds it to the run's `timings`;
+#  - memoizes the node on the state keys it reads (see NODE MEMO).
+
+class PipelineCancelled(Exception):
+    pass
+
+
+def _instrumented(name: str, node):
+    memoizable = name not in UNMEMOIZED_NODES
+
+    def run_node(state, config):
+        configurable = (config or {}).get("configurable", {})
+        cancel_event = configurable.get("cancel_event")
+        if cancel_event is not None and cancel_event.is_set():
+            raise PipelineCancelled(f"Pipeline cancelled before {name}")
+
+        memo = memoizable and NODE_MEMO_ENABLED and configurable.get("memo", True)
+        start = time.perf_counter()
+        update = _memo_lookup(name, state) if memo else None
+        if update is not None:
+            observe_memo(name, hit=True)
+            elapsed = time.perf_counter() - start
+            return {**update, "timings": {name: round(elapsed * 1000, 2)}, "memo_hits": [name]}
+
+        tracked = _ReadTracker(state) if memo else state
+        try:
+            update = node(tracked)
+        except Exception:
+            observe_node(name, time.perf_counter() - start, failed=True)
+            raise
+        elapsed = time.perf_counter() - start
+        observe_node(name, elapsed)
+        if memo:
+            observe_memo(name, hit=False)
+            _memo_store(name, tracked.reads, state, update)
+        return {**update, "timings": {name: round(elapsed * 1000, 2)}}
+
+    run_node.__name__ = node.__name__
+    return run_node
+
+
+# ---------------- CHECKPOINTS ----------------
+# Durable graphs checkpoint the state after every node into a local SQLite
+# file, keyed by run_id (the LangGraph thread_id). A run that fails, times
+# out or is cancelled can be resumed with the same run_id and only repeats
+# the unfinished nodes. Checkpoints of completed runs are deleted; those of
+# runs that failed and were never resumed are purged once the run has been
+# idle for CHECKPOINT_MAX_AGE_S (checked at a process's first durable run,
+# then at most every CACHE_PURGE_INTERVAL_S). An empty CHECKPOINT_PATH disables this.
+
+DURABLE_RUNS = os.getenv("PRICING_CHECKPOINTS", "1") != "0"
+CHECKPOINT_PATH = cache_path("CHECKPOINT_PATH", "checkpoints.sqlite")
+CHECKPOINT_MAX_AGE_S = float(os.getenv("CHECKPOINT_MAX_AGE_S", str(7 * 24 * 3600)))
+
+_checkpointer = None            # (pid, saver): SQLite connections don't survive fork
+_checkpointer_lock = threading.Lock()
+
+
+def get_checkpointer():
+    """Process-wide SqliteSaver, or None when checkpointing is disabled."""
+    global _checkpointer
+    if CHECKPOINT_PATH is None:
+        return None
+    if _checkpointer is None or _checkpointer[0] != os.getpid():
+        with _checkpointer_lock:
+            if _checkpointer is None or _checkpointer[0] != os.getpid():
+                import sqlite3
+                from langgraph.checkpoint.sqlite import SqliteSaver
+
+                os.makedirs(os.path.dirname(CHECKPOINT_PATH) or ".", exist_ok=True)
+                conn = sqlite3.connect(CHECKPOINT_PATH, check_same_thread=False)
+                saver = SqliteSaver(conn)
+                with saver.lock, saver.cursor() as cur:
+                    # last time each run started or resumed, for purging
+                    cur.execute("CREATE TABLE IF NOT EXISTS run_activity "
+                                "(thread_id TEXT PRIMARY KEY, touched_at REAL NOT NULL)")
+                _checkpointer = (os.getpid(), saver)
+    return _checkpointer[1]
+
+
+_next_checkpoint_purge = 0.0
+
+
+def touch_run(run_id: str):
+    """Mark run_id as active now; purges stale runs when a purge is due."""
+    global _next_checkpoint_purge
+    saver = get_checkpointer()
+    if saver is None:
+        return
+    with saver.lock, saver.cursor() as cur:
+        cur.execute("INSERT OR REPLACE INTO run_activity (thread_id, touched_at) VALUES (?, ?)",
+                    (run_id, time.time()))
+    if time.time() >= _next_checkpoint_purge:
+        _next_checkpoint_purge = time.time() + CACHE_PURGE_INTERVAL_S
+        purge_stale_checkpoints()
+
+
+def purge_stale_checkpoints(max_age: float = CHECKPOINT_MAX_AGE_S) -> int:
+    """Delete checkpoints of runs idle for max_age seconds; returns how many runs."""
+    saver = get_checkpointer()
+    if saver is None:
+        return 0
+    cutoff = time.time() - max_age
+    with saver.lock, saver.cursor() as cur:
+        # runs without an activity row predate it; treat them as stale too
+        stale = [row[0] for row in cur.execute(
+            "SELECT DISTINCT thread_id FROM checkpoints WHERE thread_id NOT IN "
+            "(SELECT thread_id FROM run_activity WHERE touched_at >= ?)", (cutoff,)
+        ).fetchall()]
+        for run_id in stale:
+            cur.execute("DELETE FROM writes WHERE thread_id = ?", (run_id,))
+            cur.execute("DELETE FROM checkpoints WHERE thread_id = ?", (run_id,))
+        cur.execute("DELETE FROM run_activity WHERE touched_at < ?", (cutoff,))
+    return len(stale)
+
+
+def delete_checkpoints(run_id: str):
+    saver = get_checkpointer()
+    if saver is None:
+        return
+    with saver.lock, saver.cursor() as cur:
+        cur.execute("DELETE FROM writes WHERE thread_id = ?", (run_id,))
+        cur.execute("DELETE FROM checkpoints WHERE thread_id = ?", (run_id,))
+        cur.execute("DELETE FROM run_activity WHERE thread_id = ?", (run_id,))
 
 
 # ---------------- GRAPH ----------------
 
-def create_pricing_agent():
+def create_pricing_agent(durable: bool = False):
 
     workflow = StateGraph(PricingAgentState)
 
-    workflow.add_node("search_product", search_product_node)
-    workflow.add_node("scrape_product", scrape_product_node)
-    workflow.add_node("analyze_narrative", analyze_narrative_node)
-    workflow.add_node("gather_competitors", gather_competitor_data_node)
-    workflow.add_node("analyze_reviews", analyze_reviews_node)
-    workflow.add_node("detect_trends", detect_trends_node)
-    workflow.add_node("calculate_experience", calculate_experience_score_node)
-    workflow.add_node("calculate_pricing", calculate_pricing_node)
-    workflow.add_node("rewrite_description", rewrite_description_node)
-    workflow.add_node("compile_output", compile_output_node)
+    workflow.add_node("search_product", _instrumented("search_product", search_product_node))
+    workflow.add_node("scrape_product", _instrumented("scrape_product", scrape_product_node))
+    workflow.add_node("analyze_narrative", _instrumented("analyze_narrative", analyze_narrative_node))
+    workflow.add_node("gather_competitors", _instrumented("gather_competitors", gather_competitor_data_node))
+    workflow.add_node("analyze_reviews", _instrumented("analyze_reviews", analyze_reviews_node))
+    workflow.add_node("detect_trends", _instrumented("detect_trends", detect_trends_node))
+    workflow.add_node("calculate_experience", _instrumented("calculate_experience", calculate_experience_score_node))
+    workflow.add_node("calculate_pricing", _instrumented("calculate_pricing", calculate_pricing_node))
+    workflow.add_node("rewrite_description", _instrumented("rewrite_description", rewrite_description_node))
+    workflow.add_node("compile_output", _instrumented("compile_output", compile_output_node))
 
     workflow.set_entry_point("search_product")
 
+    # Fan out: competitors, reviews and trends only need the search results,
+    # so they start right after search and overlap with scraping. Narrative
+    # analysis waits for the scraped product page.
     workflow.add_edge("search_product", "scrape_product")
+    workflow.add_edge("search_product", "gather_competitors")
+    workflow.add_edge("search_product", "analyze_reviews")
+    workflow.add_edge("search_product", "detect_trends")
     workflow.add_edge("scrape_product", "analyze_narrative")
-    workflow.add_edge("analyze_narrative", "gather_competitors")
-    workflow.add_edge("gather_competitors", "analyze_reviews")
-    workflow.add_edge("analyze_reviews", "detect_trends")
-    workflow.add_edge("detect_trends", "calculate_experience")
+
+    # Fan in: experience scoring runs once every branch has finished
+    workflow.add_edge(
+        ["analyze_narrative", "gather_competitors", "analyze_reviews", "detect_trends"],
+        "calculate_experience"
+    )
     workflow.add_edge("calculate_experience", "calculate_pricing")
     workflow.add_edge("calculate_pricing", "rewrite_description")
     workflow.add_edge("rewrite_description", "compile_output")
     workflow.add_edge("compile_output", END)
 
-    return workflow.compile()
+    return workflow.compile(checkpointer=get_checkpointer() if durable else None)
 
 
-# ---------------- RUNNERS ----------------
+# ---------------- COMPILED GRAPH REGISTRY ----------------
+# Building the StateGraph and compiling it is pure setup cost, and a compiled
+# graph holds no per-run state, so one instance per graph configuration is
+# shared by every caller in the process (API, examples, batch runners).
+
+_AGENT_REGISTRY: Dict[tuple, Any] = {}
+_AGENT_REGISTRY_LOCK = threading.Lock()
+
+
+def _registry_key(config: dict) -> tuple:
+    # per process: a durable graph holds its process's SQLite connection
+    return (os.getpid(),) + tuple(sorted(config.items()))
+
+
+def get_pricing_agent(**config):
+    """
+    Return the compiled pricing graph for this configuration, compiling it
+    on first use. Keyword arguments are forwarded to create_pricing_agent().
+    """
+    key = _registry_key(config)
+    agent = _AGENT_REGISTRY.get(key)
+    if agent is None:
+        with _AGENT_REGISTRY_LOCK:
+            agent = _AGENT_REGISTRY.get(key)
+            if agent is None:
+                agent = create_pricing_agent(**config)
+                _AGENT_REGISTRY[key] = agent
+    return agent
 
-def run_pricing_agent(product_query: str, product_name: str, initial_price_inr: float, supplied_description: str):
 
-    agent = create_pricing_agent()
+def warm_up_pricing_agents(*configs: dict):
+    """Compile the given graph configurations ahead of the first request."""
+    for config in configs or ({},):
+        get_pricing_agent(**config)
 
-    state = {
+
+def clear_agent_registry():
+    with _AGENT_REGISTRY_LOCK:
+        _AGENT_REGISTRY.clear()
+
+
+# ---------------- RUNNERS ----------------
+
+def build_initial_state(product_query: str, product_name: str, initial_price_inr: float, supplied_description: str,
+                        current_date: str = None) -> dict:
+    return {
         "messages": [HumanMessage(content=f"Analyze pricing for: {product_query}")],
         "product_query": product_query,
         "product_name": product_name,
         "initial_price_inr": float(initial_price_inr),
         "supplied_description": supplied_description,
+        "current_date": current_date or date.today().isoformat(),
         "search_results": {},
         "product_data": {},
         "narrative_analysis": {},
@@ -278,18 +545,214 @@ def run_pricing_agent(product_query: str, product_name: str, initial_price_inr:
         "pricing_result": {},
         "marketing_justification": {},
         "final_output": {},
-        "current_step": "start"
+        "current_step": "start",
+        "timings": {},
+        "memo_hits": []
     }
 
-    result = agent.invoke(state)
-    return result["final_output"]
+
+def finish_run(state: dict, run_id: str, started: float, resumed: bool = False) -> dict:
+    """Store the run's signals; final_output with run_id and timing breakdown."""
+    save_run_signals(run_id, state)
+    return {
+        **state["final_output"],
+        "run_id": run_id,
+        "resumed": resumed,
+        "timings": {
+            "nodes_ms": dict(state.get("timings") or {}),
+            "memoized": list(state.get("memo_hits") or []),
+            "total_ms": round((time.perf_counter() - started) * 1000, 2)
+        }
+    }
+
+
+def _run_config(run_id: str, cancel_event=None, memo: bool = True) -> dict:
+    return {"configurable": {"thread_id": run_id, "cancel_event": cancel_event, "memo": memo}}
+
+
+class RunConflict(ValueError):
+    """A run_id names an unfinished run of a different product."""
+
+
+def _resume_point(agent, config: dict, request: dict):
+    """
+    Checkpointed state of an unfinished run with this thread_id, else None.
+    Raises RunConflict when that run was started for other inputs than
+    `request` (current_date only counts when given), so a run_id cannot
+    return another product's result.
+    """
+    if agent.checkpointer is None:
+        return None
+    snapshot = agent.get_state(config)
+    if not snapshot.next:
+        return None
+
+    checkpointed = snapshot.values
+    differing = sorted(
+        key for key, value in request.items()
+        if value is not None and checkpointed.get(key) != value
+    )
+    if differing:
+        raise RunConflict(
+            f"Run {config['configurable']['thread_id']} is an unfinished run with different "
+            f"{', '.join(differing)}; use a new run_id"
+        )
+    return snapshot
+
+
+def _resume_request(product_query: str, product_name: str, initial_price_inr: float,
+                    supplied_description: str, current_date: str = None) -> dict:
+    # the inputs as build_initial_state stores them
+    return {
+        "product_query": product_query,
+        "product_name": product_name,
+        "initial_price_inr": float(initial_price_inr),
+        "supplied_description": supplied_description,
+        "current_date": current_date,
+    }
+
+
+def run_pricing_agent(product_query: str, product_name: str, initial_price_inr: float, supplied_description: str,
+                      agent=None, cancel_event=None, run_id: str = None, current_date: str = None,
+                      memo: bool = True):
+    """
+    Run the pipeline and return its final_output. With a durable agent and
+    the run_id of an unfinished run of the same inputs, the run resumes
+    after its last completed node; RunConflict if its inputs differ.
+    current_date (YYYY-MM-DD, default today) drives trend detection; memo=False
+    recomputes every node instead of reusing memoized updates.
+    """
+    agent = agent or get_pricing_agent(durable=DURABLE_RUNS)
+    run_id = run_id or uuid.uuid4().hex
+    config = _run_config(run_id, cancel_event, memo)
+
+    resume = _resume_point(agent, config, _resume_request(
+        product_query, product_name, initial_price_inr, supplied_description, current_date
+    ))
+    if resume is None:
+        graph_input = build_initial_state(product_query, product_name, initial_price_inr, supplied_description, current_date)
+    else:
+        graph_input = None
+
+    if agent.checkpointer is not None:
+        touch_run(run_id)
+
+    started = time.perf_counter()
+    result = agent.invoke(graph_input, config=config)
+
+    output = finish_run(result, run_id, started, resumed=resume is not None)
+    if agent.checkpointer is not None:
+        delete_checkpoints(run_id)
+    return output
+
+
+# ---------------- STREAMING ----------------
+# Compact per-node views of each node's update, for progress streaming.
+
+def _summarize_search(update: dict) -> dict:
+    results = update["search_results"].get("results", [])
+    return {
+        "total_hits": len(results),
+        "hits": [{"title": r.get("title"), "url": r.get("url")} for r in results[:5]],
+        "error": update["search_results"].get("error"),
+    }
+
+
+def _summarize_product(update: dict) -> dict:
+    pd = update["product_data"]
+    return {key: pd.get(key) for key in ("title", "brand", "price", "url", "scrape_allowed")}
+
+
+def _summarize_competitors(update: dict) -> dict:
+    cd = update["competitor_data"]
+    return {
+        "competitors": [
+            {key: c.get(key) for key in ("title", "price", "platform", "url")}
+            for c in cd.get("competitors", [])
+        ],
+        "price_range": cd.get("price_range"),
+        "timed_out": cd.get("timed_out", False),
+    }
+
+
+NODE_SUMMARIES = {
+    "search_product": _summarize_search,
+    "scrape_product": _summarize_product,
+    "analyze_narrative": lambda u: {
+        key: u["narrative_analysis"].get(key)
+        for key in ("story_strength", "luxury_signals", "craftsmanship_score")
+    },
+    "gather_competitors": _summarize_competitors,
+    "analyze_reviews": lambda u: {
+        key: u["review_insights"].get(key)
+        for key in ("sentiment_score", "price_satisfaction", "total_reviews_analyzed")
+    },
+    "detect_trends": lambda u: {
+        key: u["trend_insights"].get(key)
+        for key in ("trends_detected", "trend_boost_score", "demand_forecast")
+    },
+    "calculate_experience": lambda u: u["experience_score"],
+    "calculate_pricing": lambda u: {
+        key: u["pricing_result"].get(key)
+        for key in ("suggested_price", "market_baseline", "confidence_level", "price_position")
+    },
+    "rewrite_description": lambda u: u["marketing_justification"],
+    "compile_output": lambda u: u["final_output"],
+}
+
+
+def stream_pricing_agent(product_query: str, product_name: str, initial_price_inr: float, supplied_description: str,
+                         agent=None, cancel_event=None, run_id: str = None, current_date: str = None,
+                         memo: bool = True):
+    """
+    Run the graph with stream_mode="updates", yielding (node, summary) as
+    each node finishes. The last item is ("compile_output", final_output),
+    with run_id and timings set, as run_pricing_agent would return it.
+    Unfinished durable runs resume as in run_pricing_agent; only the
+    remaining nodes are streamed.
+    """
+    agent = agent or get_pricing_agent(durable=DURABLE_RUNS)
+    run_id = run_id or uuid.uuid4().hex
+    config = _run_config(run_id, cancel_event, memo)
+
+    resume = _resume_point(agent, config, _resume_request(
+        product_query, product_name, initial_price_inr, supplied_description, current_date
+    ))
+    if resume is None:
+        state = build_initial_state(product_query, product_name, initial_price_inr, supplied_description, current_date)
+        graph_input = state
+    else:
+        state = dict(resume.values)
+        graph_input = None
+
+    if agent.checkpointer is not None:
+        touch_run(run_id)
+
+    started = time.perf_counter()
+    for chunk in agent.stream(graph_input, config=config, stream_mode="updates"):
+        for node, update in chunk.items():
+            update = dict(update or {})
+            state["timings"] = merge_timings(state.get("timings"), update.pop("timings", None))
+            state["memo_hits"] = merge_memo_hits(state.get("memo_hits"), update.pop("memo_hits", None))
+            state.update(update)
+            if node == "compile_output":
+                yield node, finish_run(state, run_id, started, resumed=resume is not None)
+            else:
+                yield node, NODE_SUMMARIES[node](update)
+
+    if agent.checkpointer is not None:
+        delete_checkpoints(run_id)
 
 
 class MarketIntelligenceWorkflow:
 
+    def __init__(self, **graph_config):
+        # Shared compiled graph from the registry, not a private copy
+        self.agent = get_pricing_agent(**graph_config)
+
     def run(self, product_query: str):
-        return run_pricing_agent(product_query, product_query, 0, "")
+        return run_pricing_agent(product_query, product_query, 0, "", agent=self.agent)
 
     def run_custom(self, product_name: str, initial_price_inr: float, description: str):
         query = f"{product_name} {description}"
-        return run_pricing_agent(query, product_name, initial_price_inr, description)
+        return run_pricing_agent(query, product_name, initial_price_inr, description, agent=self.agent)
@@ -0,0 +1,206 @@
+# src/api/executor.py
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import asyncio
+import math
+import multiprocessing
+import os
+import threading
+import time
+
+# thread: pipelines share the process (caches, pooled clients, models).
+# process: CPU-heavy steps stop contending for the GIL; each worker keeps
+# its own in-memory caches and shares only the disk tiers. Workers are
+# spawned, not forked: by the time they start, this process may be running
+# the scrape-engine loop and sentiment batcher threads (dead in a fork child,
+# with their objects still set), holding locks and SQLite connections.
+PIPELINE_EXECUTOR = os.getenv("PIPELINE_EXECUTOR", "thread")
+PIPELINE_WORKERS = int(os.getenv("PIPELINE_WORKERS", "4"))
+# Runs admitted beyond the busy workers wait here; past that, requests are rejected
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "16"))
+PIPELINE_TIMEOUT_S = float(os.getenv("PIPELINE_TIMEOUT_S", "120"))
+
+
+class PipelineSaturated(Exception):
+    """No admission slot free (or the executor is shut down)."""
+
+    def __init__(self, retry_after: int, shutting_down: bool = False):
+        super().__init__("Pipeline executor is " + ("shutting down" if shutting_down else "saturated"))
+        self.retry_after = retry_after
+        self.shutting_down = shutting_down
+
+
+class PipelineTimeout(Exception):
+    pass
+
+
+class DeadlineToken:
+    """Cancel token for process workers: set once the deadline has passed."""
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+
+    def is_set(self) -> bool:
+        return time.time() >= self.deadline
+
+
+def _run_with_deadline(fn, args: tuple, deadline: float):
+    # Runs in a worker process; an Event cannot cross the process boundary,
+    # but the wall-clock deadline can
+    return fn(*args, cancel_event=DeadlineToken(deadline))
+
+
+class PipelineExecutor:
+    """
+    Runs blocking pipeline calls off the event loop.
+
+    At most workers + queue_size runs are admitted at once; further requests
+    are rejected with a Retry-After estimate instead of piling up. A slot is
+    released when the work really finishes, not when its caller gives up, so
+    timed-out runs still count until they stop. Timeouts stop the run
+    cooperatively: `fn` receives a cancel_event and checks it between steps.
+    """
+
+    def __init__(self, mode: str = PIPELINE_EXECUTOR, workers: int = PIPELINE_WORKERS,
+                 queue_size: int = PIPELINE_QUEUE_SIZE, timeout: float = PIPELINE_TIMEOUT_S):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown executor mode: {mode}")
+        self.mode = mode
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.timeout = timeout
+
+        self._pool = None
+        self._threads = None        # process mode: pool for local=True calls
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._avg_latency_s = None
+        self._counters = {"completed": 0, "failed": 0, "rejected": 0, "timed_out": 0}
+
+    def start(self):
+        with self._lock:
+            if self._pool is None:
+                if self.mode == "process":
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+                else:
+                    self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pipeline")
+
+    def shutdown(self):
+        with self._lock:
+            pools = (self._pool, self._threads)
+            self._pool = self._threads = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def retry_after(self) -> int:
+        """
+        Seconds until a slot is likely free: the oldest admitted run should be
+        done within one average latency (queue wait included).
+        """
+        return max(1, math.ceil(self._avg_latency_s or 5.0))
+
+    def _admit(self):
+        with self._lock:
+            if self._pool is None:
+                raise PipelineSaturated(self.retry_after(), shutting_down=True)
+            if self._in_flight >= self.capacity:
+                self._counters["rejected"] += 1
+                raise PipelineSaturated(self.retry_after())
+            self._in_flight += 1
+            return self._pool
+
+    def _release(self, started: float, future):
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._in_flight -= 1
+            failed = future.cancelled() or future.exception() is not None
+            self._counters["failed" if failed else "completed"] += 1
+            if not failed:
+                self._avg_latency_s = elapsed if self._avg_latency_s is None else 0.8 * self._avg_latency_s + 0.2 * elapsed
+
+    def submit(self, fn, *args, timeout: float = None, local: bool = False):
+        """
+        Admit and start fn(*args, cancel_event=...) now; returns a coroutine
+        that waits for the result. Raises PipelineSaturated right away when
+        no slot is free, so callers can answer 429 before committing to a
+        response. `local` runs the call in a thread of this process even in
+        process mode, for work that calls back into the event loop.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        pool = self._admit()
+        started = time.perf_counter()
+
+        try:
+            if self.mode == "process" and not local:
+                cancel_event = None
+                future = pool.submit(_run_with_deadline, fn, args, time.time() + timeout)
+            else:
+                if self.mode == "process":
+                    pool = self._local_pool()
+                cancel_event = threading.Event()
+                future = pool.submit(fn, *args, cancel_event=cancel_event)
+        except Exception:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        future.add_done_callback(lambda f: self._release(started, f))
+        return self._wait(future, cancel_event, timeout)
+
+    async def _wait(self, future, cancel_event, timeout: float):
+        # asyncio.wait rather than wait_for: a TimeoutError raised by the work
+        # itself (e.g. an upstream API timeout) must not look like ours
+        waiter = asyncio.wrap_future(future)
+        try:
+            done, _ = await asyncio.wait({waiter}, timeout=timeout)
+            if not done:
+                with self._lock:
+                    self._counters["timed_out"] += 1
+                raise PipelineTimeout(f"Pipeline did not finish within {timeout:g}s")
+            return waiter.result()
+        finally:
+            # timeout, client disconnect or error: stop queued work outright
+            # and running work at its next node boundary
+            if not future.done():
+                # cancels the pool future too; the abandoned result is dropped
+                waiter.cancel()
+                if cancel_event is not None:
+                    cancel_event.set()
+
+    async def run(self, fn, *args, timeout: float = None, local: bool = False):
+        """
+        Run fn(*args, cancel_event=...) in the pool. Raises PipelineSaturated
+        when no slot is free and PipelineTimeout after `timeout` seconds.
+        """
+        return await self.submit(fn, *args, timeout=timeout, local=local)
+
+    def _local_pool(self):
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pipeline")
+            return self._threads
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "workers": self.workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "avg_latency_s": round(self._avg_latency_s, 3) if self._avg_latency_s is not None else None,
+                **self._counters,
+            }
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_pipeline_executor() -> PipelineExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = PipelineExecutor()
+    return _executor
@@ -1,23 +1,95 @@
 # src/api/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from agent.workflow import run_pricing_agent
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, List, Optional
+from datetime import date
+import asyncio
+import json
+import time
+import uuid
 import uvicorn
 import os
+import sys
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# ensure import paths (project root, so `src.` imports resolve when run as a script)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.agent.workflow import (
+    run_pricing_agent, stream_pricing_agent, get_pricing_agent, warm_up_pricing_agents, DURABLE_RUNS, RunConflict
+)
+from src.agent.simulation import simulate_pricing, UnknownRunError
+from src.api.executor import get_pipeline_executor, PipelineSaturated, PipelineTimeout
+from src.tools.sentiment import get_sentiment_batcher
+from src.tools.cache import get_cache_stats
+from src.observability.metrics import Gauges, register, render_prometheus
+
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "1000"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+
+
+# ---------------- METRICS ----------------
+# Node and external-call latencies are recorded where they happen; cache,
+# executor and sentiment queue figures are read from their stats at scrape time.
+
+def _stat_series(get_stats, key: str):
+    return lambda: {(name,): stats[key] for name, stats in get_stats().items()}
+
+
+for _key, _type, _help in (
+    ("hits", "counter", "Cache lookups served fresh from memory or disk"),
+    ("stale_hits", "counter", "Cache lookups served stale while a refresh runs"),
+    ("misses", "counter", "Cache lookups that had to compute the value"),
+    ("evictions", "counter", "Entries evicted from the memory tier"),
+    ("hit_rate", "gauge", "Fresh hits / lookups since start"),
+    ("memory_size", "gauge", "Entries in the memory tier"),
+):
+    register(Gauges(f"profitstory_cache_{_key}" + ("_total" if _type == "counter" else ""),
+                    _help, ("cache",), _stat_series(get_cache_stats, _key), type=_type))
+
+for _key, _type, _help in (
+    ("in_flight", "gauge", "Pipeline runs admitted and not yet finished"),
+    ("rejected", "counter", "Pipeline runs rejected because the pool was saturated"),
+    ("timed_out", "counter", "Pipeline runs that hit their request timeout"),
+):
+    register(Gauges(f"profitstory_pipeline_{_key}" + ("_total" if _type == "counter" else ""),
+                    _help, (), lambda key=_key: {(): get_pipeline_executor().stats()[key]}, type=_type))
+
+register(Gauges("profitstory_sentiment_queue_depth", "Texts waiting for the sentiment micro-batcher", (),
+                lambda: {(): get_sentiment_batcher().stats()["queue_depth"]}))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Compile the pricing graph once at startup; every request reuses it
+    warm_up_pricing_agents({"durable": DURABLE_RUNS})
+    executor = get_pipeline_executor()
+    executor.start()
+    yield
+    executor.shutdown()
+
+
 app = FastAPI(
     title="ProfitStory Pricing Intelligence API - Powered by Gemini 2.0 Flash",
     description="Experience-Driven Pricing Agent using Google Gemini",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 class PricingRequest(BaseModel):
     product_query: str
     platform_filters: list = None
-    
+    timeout_s: Optional[float] = None
+    # resume an unfinished run (from an earlier error response) instead of starting over
+    run_id: Optional[str] = None
+    # date trends are detected for (default today); rerunning a query with a
+    # new date only recomputes the nodes that depend on it
+    current_date: Optional[date] = None
+
 class PricingResponse(BaseModel):
     product_title: str
     brand: str
@@ -28,26 +100,277 @@ class PricingResponse(BaseModel):
     marketing_justification: str
     full_analysis: dict
 
+class BatchPricingItem(BaseModel):
+    # run_id / timeout_s are per-run options that don't apply to deduplicated
+    # batch items; rejecting them beats silently dropping them
+    model_config = ConfigDict(extra="forbid")
+
+    product_query: str
+    current_date: Optional[date] = None
+
+class BatchPricingRequest(BaseModel):
+    items: List[BatchPricingItem]
+    max_concurrency: Optional[int] = None
+
+class BatchItemResult(BaseModel):
+    index: int
+    product_query: str
+    normalized_query: str
+    status: str
+    result: Optional[PricingResponse] = None
+    error: Optional[str] = None
+
+class BatchPricingResponse(BaseModel):
+    total_items: int
+    unique_queries: int
+    succeeded: int
+    failed: int
+    results: List[BatchItemResult]
+
+class SimulationRequest(BaseModel):
+    run_id: Optional[str] = None
+    signals: Optional[dict] = None
+    overrides: Dict[str, object] = {}
+    sweep: Dict[str, List[float]] = {}
+
+class SimulationResponse(BaseModel):
+    run_id: Optional[str] = None
+    inputs: dict
+    result: PricingResponse
+    sweep: List[dict]
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def iso_date(value: Optional[date]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def run_query(product_query: str, run_id: str = None, current_date: str = None, cancel_event=None) -> dict:
+    return run_pricing_agent(product_query, product_query, 0, "", agent=get_pricing_agent(durable=DURABLE_RUNS),
+                             cancel_event=cancel_event, run_id=run_id, current_date=current_date)
+
+
+def stream_query(product_query: str, run_id: str, current_date: str, emit, cancel_event=None):
+    for node, summary in stream_pricing_agent(product_query, product_query, 0, "",
+                                              agent=get_pricing_agent(durable=DURABLE_RUNS),
+                                              cancel_event=cancel_event, run_id=run_id,
+                                              current_date=current_date):
+        emit(node, summary)
+
+
+def sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def request_timeout(timeout_s: Optional[float]) -> float:
+    """Per-request timeout; callers can shorten the server default, not extend it."""
+    default = get_pipeline_executor().timeout
+    return default if timeout_s is None else max(0.1, min(timeout_s, default))
+
+
+def saturated_response(e: PipelineSaturated) -> JSONResponse:
+    return JSONResponse(
+        status_code=503 if e.shutting_down else 429,
+        content={"detail": str(e)},
+        headers={"Retry-After": str(e.retry_after)}
+    )
+
+
+def build_pricing_response(result: dict) -> PricingResponse:
+    pricing = result.get("pricing_result") or {}
+    justification = result.get("marketing_justification") or {}
+    if isinstance(justification, dict):
+        justification = justification.get("marketing_copy") or ""
+
+    return PricingResponse(
+        product_title=result.get("product_title") or "",
+        brand=result.get("brand") or "",
+        suggested_price=result.get("suggested_price") or 0,
+        market_baseline=pricing.get("market_baseline") or 0,
+        experience_score=result.get("experience_score") or 0,
+        confidence_level=pricing.get("confidence_level", "low"),
+        marketing_justification=justification,
+        full_analysis=result
+    )
+
+
 @app.post("/api/v1/analyze-pricing", response_model=PricingResponse)
 async def analyze_pricing(request: PricingRequest):
     """
-    Analyze product and generate pricing recommendation using Gemini
+    Analyze product and generate pricing recommendation using Gemini.
+    The pipeline runs in the bounded worker pool, so the event loop (and
+    /health) stays responsive while it runs. Failures and timeouts report
+    the run_id; sending it back resumes the run from its last completed node.
     """
+    run_id = request.run_id or uuid.uuid4().hex
     try:
-        result = run_pricing_agent(request.product_query)
-        
-        return PricingResponse(
-            product_title=result["product_title"],
-            brand=result["brand"],
-            suggested_price=result["suggested_price"],
-            market_baseline=result["market_baseline"],
-            experience_score=result["experience_score"],
-            confidence_level=result["confidence_level"],
-            marketing_justification=result["marketing_justification"],
-            full_analysis=result
+        result = await get_pipeline_executor().run(
+            run_query, request.product_query, run_id, iso_date(request.current_date),
+            timeout=request_timeout(request.timeout_s)
         )
+        return build_pricing_response(result)
+    except PipelineSaturated as e:
+        return saturated_response(e)
+    except PipelineTimeout as e:
+        raise HTTPException(status_code=504, detail={"error": str(e), "run_id": run_id})
+    except RunConflict as e:
+        raise HTTPException(status_code=409, detail={"error": str(e), "run_id": run_id})
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail={"error": str(e), "run_id": run_id})
+
+@app.post("/api/v1/analyze-pricing/stream")
+async def analyze_pricing_stream(request: PricingRequest):
+    """
+    Same analysis as /api/v1/analyze-pricing, streamed as server-sent events:
+    a `node` event as each pipeline step finishes (search hits, scraped
+    product, competitor prices, experience score, suggested price, marketing
+    copy), then `result` with the full response, or `error`.
+    """
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+    started = time.perf_counter()
+
+    def emit(node: str, summary: dict):
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        loop.call_soon_threadsafe(events.put_nowait, {"node": node, "elapsed_ms": elapsed_ms, "data": summary})
+
+    run_id = request.run_id or uuid.uuid4().hex
+    try:
+        # admitted (or rejected with 429) before the stream starts
+        pending = get_pipeline_executor().submit(
+            stream_query, request.product_query, run_id, iso_date(request.current_date), emit,
+            timeout=request_timeout(request.timeout_s), local=True
+        )
+    except PipelineSaturated as e:
+        return saturated_response(e)
+
+    async def event_stream():
+        run = asyncio.ensure_future(pending)
+        run.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            yield sse_event("start", {"product_query": request.product_query, "run_id": run_id})
+            final_output = None
+            while (item := await events.get()) is not None:
+                if item["node"] == "compile_output":
+                    final_output = item["data"]
+                else:
+                    yield sse_event("node", item)
+
+            run.result()
+            yield sse_event("result", build_pricing_response(final_output).model_dump())
+        except PipelineTimeout as e:
+            yield sse_event("error", {"status": 504, "detail": str(e), "run_id": run_id})
+        except RunConflict as e:
+            yield sse_event("error", {"status": 409, "detail": str(e), "run_id": run_id})
+        except Exception as e:
+            yield sse_event("error", {"status": 500, "detail": str(e), "run_id": run_id})
+        finally:
+            # client went away: cancel the run at its next node boundary
+            run.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/v1/analyze-pricing/batch", response_model=BatchPricingResponse)
+async def analyze_pricing_batch(request: BatchPricingRequest):
+    """
+    Price many products in one call. Items with the same current_date whose
+    queries are identical after normalization (case, whitespace) run once
+    and share their result; unique queries run with bounded concurrency. Overlapping search, scrape and LLM
+    work between them is shared through the tool caches.
+    """
+    if len(request.items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"At most {BATCH_MAX_ITEMS} items per batch")
+
+    groups = {}
+    for index, item in enumerate(request.items):
+        key = (normalize_query(item.product_query), iso_date(item.current_date))
+        groups.setdefault(key, []).append(index)
+
+    semaphore = asyncio.Semaphore(max(1, min(request.max_concurrency or BATCH_CONCURRENCY, BATCH_CONCURRENCY)))
+    executor = get_pipeline_executor()
+
+    async def price(key: tuple):
+        query, current_date = key
+        async with semaphore:
+            deadline = time.monotonic() + executor.timeout
+            while True:
+                try:
+                    result = await executor.run(run_query, query, None, current_date)
+                    return key, build_pricing_response(result), None
+                except PipelineSaturated as e:
+                    # a batch waits for pool slots instead of failing its items
+                    if e.shutting_down or time.monotonic() + 1 > deadline:
+                        return key, None, str(e)
+                    await asyncio.sleep(min(e.retry_after, 1))
+                except Exception as e:
+                    return key, None, str(e)
+
+    outcomes = await asyncio.gather(*(price(key) for key in groups if key[0]))
+
+    results = [None] * len(request.items)
+    for key, response, error in outcomes:
+        query = key[0]
+        for index in groups[key]:
+            results[index] = BatchItemResult(
+                index=index,
+                product_query=request.items[index].product_query,
+                normalized_query=query,
+                status="error" if error else "ok",
+                result=response,
+                error=error
+            )
+    for key, indexes in groups.items():
+        if key[0]:
+            continue
+        for index in indexes:
+            results[index] = BatchItemResult(
+                index=index, product_query=request.items[index].product_query,
+                normalized_query="", status="error", error="Empty product_query"
+            )
+
+    succeeded = sum(1 for r in results if r.status == "ok")
+    return BatchPricingResponse(
+        total_items=len(results),
+        unique_queries=len([key for key in groups if key[0]]),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results
+    )
+
+@app.post("/api/v1/simulate", response_model=SimulationResponse)
+async def simulate(request: SimulationRequest):
+    """
+    What-if pricing for a stored run (run_id from analyze-pricing) or for
+    supplied upstream signals. Only the pricing stage is re-evaluated, so
+    this is cheap enough for interactive sliders.
+    """
+    if not request.run_id and request.signals is None:
+        raise HTTPException(status_code=422, detail="Provide run_id or signals")
+    try:
+        simulation = simulate_pricing(
+            run_id=request.run_id,
+            signals=request.signals,
+            overrides=request.overrides,
+            sweep=request.sweep
+        )
+    except UnknownRunError:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired run: {request.run_id}")
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return SimulationResponse(
+        run_id=simulation["run_id"],
+        inputs=simulation["inputs"],
+        result=build_pricing_response(simulation["final_output"]),
+        sweep=simulation["sweep"]
+    )
 
 @app.get("/health")
 async def health_check():
@@ -57,5 +380,20 @@ async def health_check():
         "framework": "LangChain + LangGraph"
     }
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text exposition of latencies, errors, cache and pool stats"""
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+@app.get("/api/v1/stats/pipeline")
+async def pipeline_stats():
+    """Admission and completion counters of the pipeline worker pool"""
+    return get_pipeline_executor().stats()
+
+@app.get("/api/v1/stats/sentiment")
+async def sentiment_stats():
+    """Queue depth and batch-size stats of the shared sentiment inference service"""
+    return get_sentiment_batcher().stats()
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,223 @@
+# src/cli/bulk.py
+#
+# Bulk catalogue pricing through the full pipeline. Products are streamed
+# from the input and results appended to a JSONL file as they finish, so
+# memory stays flat however large the catalogue is. Restarting with the same
+# output skips products already priced there; a product that was mid-run
+# when the process died resumes from its checkpoint (run ids are derived
+# from the product's id and fields).
+#
+#   python -m src.cli.bulk --input catalogue.csv --output priced.jsonl --concurrency 8
+#
+# Input rows (CSV or JSONL) need `name`; `price` (INR), `description` and
+# `id` are optional. Without an id column, products are identified by
+# name + price + description. Output lines are
+#   {"id": ..., "status": "ok", "result": {...final_output...}}
+#   {"id": ..., "status": "error", "error": "...", "run_id": "..."}
+# and only "ok" lines count as done on restart.
+
+import argparse
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.agent.workflow import run_pricing_agent, get_pricing_agent, DURABLE_RUNS, PipelineCancelled
+from src.tools.cache import make_cache_key
+
+
+def read_products(path: str, id_column: str):
+    """
+    Yield (product_id, name, price, description) one input row at a time, or
+    None for a row that cannot be priced (reported on stderr and counted as
+    skipped).
+    """
+    opener = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+    with opener as f:
+        rows = csv.DictReader(f) if path.endswith(".csv") else (line for line in f if line.strip())
+        for line_no, row in enumerate(rows, start=1):
+            if isinstance(row, str):
+                try:
+                    row = json.loads(row)
+                except json.JSONDecodeError as e:
+                    print(f"skipping row {line_no}: bad JSON ({e.msg})", file=sys.stderr)
+                    yield None
+                    continue
+                if not isinstance(row, dict):
+                    print(f"skipping row {line_no}: not an object", file=sys.stderr)
+                    yield None
+                    continue
+            name = str(row.get("name") or "").strip()
+            if not name:
+                print(f"skipping row {line_no}: no name", file=sys.stderr)
+                yield None
+                continue
+            try:
+                price = float(row.get("price") or 0)
+            except (TypeError, ValueError):
+                print(f"skipping row {line_no}: bad price {row.get('price')!r}", file=sys.stderr)
+                yield None
+                continue
+            description = str(row.get("description") or "").strip()
+            product_id = row.get(id_column)
+            if product_id in (None, ""):
+                product_id = make_cache_key(name, price, description)[:16]
+            yield str(product_id), name, price, description
+
+
+def completed_ids(path: str) -> set:
+    """Ids with an "ok" line in an earlier output; torn or failed lines are retried."""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue            # last line of a crashed run
+            if record.get("status") == "ok":
+                done.add(str(record.get("id")))
+    return done
+
+
+def open_output(path: str):
+    out = open(path, "a+", encoding="utf-8")
+    # a crash can leave a torn last line; start ours on a fresh one
+    if out.tell() > 0:
+        out.seek(out.tell() - 1)
+        if out.read(1) != "\n":
+            out.write("\n")
+    return out
+
+
+def run_id_for(product: tuple) -> str:
+    # an edited row starts a new run instead of conflicting with its old checkpoint
+    return make_cache_key("bulk", *product)[:32]
+
+
+def price_product(agent, product: tuple, current_date: str, cancel_event) -> dict:
+    product_id, name, price, description = product
+    run_id = run_id_for(product)
+    try:
+        # same query shape as MarketIntelligenceWorkflow.run_custom
+        result = run_pricing_agent(f"{name} {description}".strip(), name, price, description, agent=agent,
+                                   cancel_event=cancel_event, run_id=run_id, current_date=current_date)
+        return {"id": product_id, "status": "ok", "result": result}
+    except Exception as e:
+        if isinstance(e, PipelineCancelled) or cancel_event.is_set():
+            raise               # interrupted, not failed: nothing to record
+        return {"id": product_id, "status": "error", "error": str(e), "run_id": run_id}
+
+
+class Progress:
+    """Counts and periodic throughput lines on stderr."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.last_report = self.started
+        self.counts = {"ok": 0, "error": 0, "skipped": 0}
+
+    def record(self, status: str):
+        self.counts[status] += 1
+        now = time.perf_counter()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report()
+
+    def report(self, final: bool = False):
+        elapsed = time.perf_counter() - self.started
+        finished = self.counts["ok"] + self.counts["error"]
+        rate = finished / elapsed if elapsed > 0 else 0.0
+        print(f"{'done' if final else 'progress'}: {self.counts['ok']} ok, {self.counts['error']} failed, "
+              f"{self.counts['skipped']} skipped  {rate:.2f} products/s  {elapsed:.0f}s elapsed",
+              file=sys.stderr, flush=True)
+
+
+def run_bulk(products, output_path: str, concurrency: int, current_date: str = None,
+             progress_interval: float = 5.0) -> dict:
+    """
+    Price `products` (an iterable of read_products items) with at most
+    `concurrency` pipelines running and as many queued, appending a line to
+    output_path the moment each finishes. Returns the final counts.
+    """
+    done = completed_ids(output_path)
+    progress = Progress(progress_interval)
+    agent = get_pricing_agent(durable=DURABLE_RUNS)
+    cancel_event = threading.Event()
+    # bounded read-ahead: never more than 2x concurrency products in memory
+    slots = threading.BoundedSemaphore(2 * concurrency)
+    lock = threading.Lock()
+    pending = set()
+
+    with open_output(output_path) as out, ThreadPoolExecutor(max_workers=concurrency,
+                                                              thread_name_prefix="bulk") as pool:
+
+        def finished(future):
+            # runs in the worker thread as soon as the product is priced: a
+            # finished run's checkpoints are already gone, so it must not
+            # wait in memory for a crash to lose it
+            with lock:
+                pending.discard(future)
+                if not future.cancelled() and future.exception() is None:
+                    record = future.result()
+                    out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                    out.flush()
+                    progress.record(record["status"])
+            slots.release()
+
+        try:
+            for product in products:
+                if product is None or product[0] in done:
+                    progress.counts["skipped"] += 1
+                    continue
+                done.add(product[0])        # duplicate ids in the input run once
+                slots.acquire()
+                future = pool.submit(price_product, agent, product, current_date, cancel_event)
+                with lock:
+                    pending.add(future)
+                future.add_done_callback(finished)
+        except KeyboardInterrupt:
+            # queued products are dropped; running ones stop at their next
+            # node and resume from their checkpoints on the next invocation
+            cancel_event.set()
+            with lock:
+                queued = list(pending)
+            for future in queued:
+                future.cancel()         # runs `finished`, which takes the lock
+            print("interrupted; rerun the same command to continue", file=sys.stderr)
+            raise
+
+    progress.report(final=True)
+    return progress.counts
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Price a product catalogue through the full pipeline")
+    parser.add_argument("--input", required=True, help="CSV or JSONL with name, price, description ('-' for JSONL on stdin)")
+    parser.add_argument("--output", required=True, help="JSONL results file; appended to, and resumed from")
+    parser.add_argument("--concurrency", type=int, default=4, help="pipelines running at once")
+    parser.add_argument("--id-column", default="id", help="input column identifying a product")
+    parser.add_argument("--current-date", help="YYYY-MM-DD to detect trends for (default today)")
+    parser.add_argument("--progress-interval", type=float, default=5.0, help="seconds between throughput lines")
+    args = parser.parse_args(argv)
+
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    try:
+        counts = run_bulk(read_products(args.input, args.id_column), args.output, args.concurrency,
+                          args.current_date, args.progress_interval)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    sys.exit(1 if counts["error"] else 0)
+
+
+if __name__ == "__main__":
+    main()
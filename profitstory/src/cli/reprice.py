@@ -0,0 +1,133 @@
+# src/cli/reprice.py
+#
+# Pricing-only entry point: reprice products from cached signals with the
+# vectorized engine. Imports numpy and the run store only; no LangChain,
+# LangGraph, torch or HTTP clients, so it starts in a fraction of a second.
+#
+#   python -m src.cli.reprice --input catalogue.csv --output priced.csv
+#   python -m src.cli.reprice --run-id 3f2c... --set experience_score=75
+#
+# Input rows (CSV or JSONL) hold the pricing inputs by name: market_baseline,
+# experience_score, trend_boost_score, brand_strength, craftsmanship_score
+# and competitor_prices (a JSON list, or ';'-separated in CSV). Any other
+# columns (ids, SKUs) are copied to the output.
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.tools.pricing_engine import DEFAULTS, price_catalogue, to_records
+
+INPUT_COLUMNS = tuple(DEFAULTS) + ("competitor_prices",)
+
+
+def _number(value):
+    return None if value in (None, "") else float(value)
+
+
+def _prices(value) -> list:
+    if value in (None, ""):
+        return []
+    if isinstance(value, list):
+        return value
+    value = value.strip()
+    if value.startswith("["):
+        return json.loads(value)
+    return [float(p) for p in value.split(";") if p.strip()]
+
+
+def read_rows(path: str) -> list:
+    opener = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+    with opener as f:
+        if path.endswith(".csv"):
+            return list(csv.DictReader(f))
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def rows_from_runs(run_ids: list) -> list:
+    from src.agent.runs import build_pricing_inputs, load_run_signals
+
+    rows = []
+    for run_id in run_ids:
+        signals = load_run_signals(run_id)
+        if signals is None:
+            raise SystemExit(f"Unknown or expired run: {run_id}")
+        rows.append({"run_id": run_id, **build_pricing_inputs(signals)})
+    return rows
+
+
+def reprice(rows: list, overrides: dict = None) -> list:
+    """Price rows in one vectorized pass; returns extra columns + pricing per row."""
+    overrides = overrides or {}
+    columns = {
+        name: [_number(overrides.get(name, row.get(name, default))) for row in rows]
+        for name, default in DEFAULTS.items()
+    }
+    # missing cells fall back to the engine defaults, as pricing_engine_tool does
+    for name, values in columns.items():
+        columns[name] = [DEFAULTS[name] if v is None else v for v in values]
+
+    competitor_prices = [
+        _prices(overrides.get("competitor_prices", row.get("competitor_prices"))) for row in rows
+    ]
+    result = price_catalogue(**columns, competitor_prices=competitor_prices, size=len(rows))
+
+    return [
+        {**{k: v for k, v in row.items() if k not in INPUT_COLUMNS}, **record}
+        for row, record in zip(rows, to_records(result))
+    ]
+
+
+def write_rows(records: list, path: str):
+    out = sys.stdout if path == "-" else open(path, "w", newline="", encoding="utf-8")
+    try:
+        if path.endswith(".csv"):
+            fieldnames = list(dict.fromkeys(key for record in records for key in record))
+            writer = csv.DictWriter(out, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(records)
+        else:
+            for record in records:
+                out.write(json.dumps(record) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def parse_overrides(pairs: list) -> dict:
+    overrides = {}
+    for pair in pairs:
+        name, _, value = pair.partition("=")
+        if name not in INPUT_COLUMNS:
+            raise SystemExit(f"Cannot override {name!r}; choose from {', '.join(INPUT_COLUMNS)}")
+        overrides[name] = value
+    return overrides
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Reprice products from cached signals (no graph, no network)")
+    parser.add_argument("--input", help="CSV or JSONL of pricing inputs ('-' for JSONL on stdin)")
+    parser.add_argument("--run-id", action="append", default=[], help="stored run to reprice (repeatable)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="override an input for every row (repeatable)")
+    parser.add_argument("--output", default="-", help="CSV or JSONL output path (default: JSONL on stdout)")
+    args = parser.parse_args(argv)
+
+    if not args.input and not args.run_id:
+        parser.error("give --input and/or --run-id")
+
+    start = time.perf_counter()
+    rows = (read_rows(args.input) if args.input else []) + rows_from_runs(args.run_id)
+    records = reprice(rows, parse_overrides(args.set))
+    write_rows(records, args.output)
+
+    print(f"repriced {len(records)} products in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# src/observability/metrics.py
+from contextlib import contextmanager
+import bisect
+import threading
+import time
+
+# Latency buckets in seconds: sub-ms keyword scoring up to multi-second LLM calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues, amount: float = 1):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def render(self) -> list:
+        with self._lock:
+            values = dict(self._values)
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labelvalues, value in sorted(values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labelvalues)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets)
+        self._series = {}           # labelvalues -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list:
+        with self._lock:
+            snapshot = {key: list(series) for key, series in self._series.items()}
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        labelnames = self.labelnames + ("le",)
+        for labelvalues, series in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{_labels(labelnames, labelvalues + (_number(bound),))} {cumulative}"
+                )
+            label_str = _labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{label_str} {_number(series[-2])}")
+            lines.append(f"{self.name}_count{label_str} {series[-1]}")
+        return lines
+
+
+class Gauges:
+    """Point-in-time values computed at scrape time, e.g. from cache stats."""
+
+    def __init__(self, name: str, help: str, labelnames: tuple, collect, type: str = "gauge"):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.collect = collect      # () -> {labelvalues tuple: value}
+        self.type = type
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        for labelvalues, value in sorted(self.collect().items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labelvalues)} {_number(value)}")
+        return lines
+
+
+# ---------------- REGISTRY ----------------
+
+_METRICS = {}
+_METRICS_LOCK = threading.Lock()
+
+
+def register(metric):
+    """Add a metric (or return the one already registered under its name)."""
+    with _METRICS_LOCK:
+        return _METRICS.setdefault(metric.name, metric)
+
+
+def render_prometheus() -> str:
+    """All registered metrics in the Prometheus text exposition format."""
+    with _METRICS_LOCK:
+        metrics = list(_METRICS.values())
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ---------------- PIPELINE METRICS ----------------
+
+NODE_LATENCY = register(Histogram(
+    "profitstory_node_duration_seconds", "Time spent in each pricing graph node", ("node",)
+))
+NODE_ERRORS = register(Counter(
+    "profitstory_node_errors_total", "Pricing graph node failures", ("node",)
+))
+NODE_MEMO_LOOKUPS = register(Counter(
+    "profitstory_node_memo_total", "Node memo lookups by result (hit or miss)", ("node", "result")
+))
+EXTERNAL_LATENCY = register(Histogram(
+    "profitstory_external_call_duration_seconds",
+    "Latency of calls leaving the process (search API, robots.txt, page fetches, model inference, LLM)",
+    ("call",)
+))
+EXTERNAL_ERRORS = register(Counter(
+    "profitstory_external_call_errors_total", "Failed external calls", ("call",)
+))
+
+
+@contextmanager
+def timed(call: str):
+    """Record the latency of an external call, counting it as an error if it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        EXTERNAL_ERRORS.inc(call)
+        raise
+    finally:
+        EXTERNAL_LATENCY.observe(time.perf_counter() - start, call)
+
+
+def observe_node(node: str, seconds: float, failed: bool = False):
+    NODE_LATENCY.observe(seconds, node)
+    if failed:
+        NODE_ERRORS.inc(node)
+
+
+def observe_memo(node: str, hit: bool):
+    NODE_MEMO_LOOKUPS.inc(node, "hit" if hit else "miss")
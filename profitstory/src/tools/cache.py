@@ -0,0 +1,324 @@
+# src/tools/cache.py
+from collections import OrderedDict
+from concurrent.futures import Future
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Default home for on-disk cache tiers
+CACHE_DIR = os.getenv(
+    "PROFITSTORY_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "profitstory")
+)
+
+
+def cache_path(env_var: str, filename: str):
+    """Disk path for a cache: env override, '' disables, else CACHE_DIR/filename."""
+    value = os.getenv(env_var)
+    if value is None:
+        return os.path.join(CACHE_DIR, filename)
+    return value or None
+
+
+def make_cache_key(*parts) -> str:
+    """Content address for JSON-serialisable inputs (dict key order does not matter)."""
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheEntry:
+    def __init__(self, value, stored_at: float = None):
+        self.value = value
+        self.stored_at = time.time() if stored_at is None else stored_at
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+
+# How often a disk tier drops rows past its max age (also done when opened)
+CACHE_PURGE_INTERVAL_S = float(os.getenv("CACHE_PURGE_INTERVAL_S", "3600"))
+
+
+class SQLiteCacheStore:
+    """
+    Disk tier for TieredCache: one table per cache, values stored as JSON.
+    With max_entries set, the oldest rows are evicted past that bound; with
+    max_age set, rows older than that are purged when the file is opened
+    and then every CACHE_PURGE_INTERVAL_S.
+
+    The file is opened on first use, not at import, and reopened in a
+    forked child (SQLite connections must not cross fork).
+    """
+
+    def __init__(self, path: str, table: str, max_entries: int = None, max_age: float = None):
+        self.path = path
+        self.table = "cache_" + "".join(c if c.isalnum() else "_" for c in table)
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        self._next_purge = 0.0
+
+    def _connection(self):
+        # caller holds self._lock
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn, self._pid, self._next_purge = conn, os.getpid(), 0.0
+
+        if self.max_age is not None and time.time() >= self._next_purge:
+            self._next_purge = time.time() + CACHE_PURGE_INTERVAL_S
+            self._conn.execute(
+                f"DELETE FROM {self.table} WHERE stored_at < ?", (time.time() - self.max_age,)
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str):
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT value, stored_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1])
+
+    def set(self, key: str, entry: CacheEntry) -> int:
+        """Store an entry; returns how many old rows were evicted to make room."""
+        evicted = 0
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, json.dumps(entry.value, ensure_ascii=False), entry.stored_at)
+            )
+            if self.max_entries:
+                evicted = conn.execute(
+                    f"DELETE FROM {self.table} WHERE key IN ("
+                    f"SELECT key FROM {self.table} ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                ).rowcount
+            conn.commit()
+        return max(evicted, 0)
+
+    def delete(self, key: str):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            conn.commit()
+
+    def purge_older_than(self, max_age: float):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE stored_at < ?", (time.time() - max_age,)
+            )
+            conn.commit()
+
+    def clear(self):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
+
+
+_CACHES = {}
+
+
+class TieredCache:
+    """
+    Two-tier result cache: an in-memory LRU in front of an optional SQLite
+    file, both honouring the same TTL (None = never expires).
+
+    get() only returns fresh entries; get_entry() also returns expired ones
+    up to a caller's stale window, so callers can serve stale data while they
+    refresh it. get_or_compute() makes concurrent misses on one key share a
+    single computation.
+
+    Entries older than max_age (default: the TTL) are dropped from both
+    tiers; caches serving stale entries pass their stale horizon instead.
+    """
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl: float = None,
+                 path: str = None, max_disk_entries: int = None, max_age: float = None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_age = ttl if max_age is None else max_age
+        self.disk = SQLiteCacheStore(path, name, max_disk_entries, self.max_age) if path else None
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._counters = {
+            "memory_hits": 0, "disk_hits": 0, "misses": 0,
+            "stale_hits": 0, "sets": 0, "evictions": 0
+        }
+        _CACHES[name] = self
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        return self.ttl is None or entry.age <= self.ttl
+
+    def _is_expired(self, entry: CacheEntry) -> bool:
+        return self.max_age is not None and entry.age > self.max_age
+
+    def _count(self, counter: str, n: int = 1):
+        with self._lock:
+            self._counters[counter] += n
+
+    def _remember(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+                self._counters["evictions"] += 1
+            # least recently used entries that have aged out go too
+            while self._memory and self._is_expired(next(iter(self._memory.values()))):
+                self._memory.popitem(last=False)
+
+    def _lookup(self, key: str):
+        """Return (entry, tier) from the first tier holding the key, fresh or not, unless past max_age."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._is_expired(entry):
+                    self._memory.move_to_end(key)
+                    return entry, "memory"
+                del self._memory[key]
+
+        if self.disk is not None:
+            entry = self.disk.get(key)
+            # rows past max_age linger on disk until the next purge
+            if entry is not None and not self._is_expired(entry):
+                self._remember(key, entry)
+                return entry, "disk"
+
+        return None, None
+
+    def get_entry(self, key: str, max_stale: float = None):
+        """
+        Entry for key if fresh or at most max_stale seconds old (default
+        max_age), else None. Counts a hit, a stale hit or a miss.
+        """
+        entry, tier = self._lookup(key)
+        if entry is None:
+            self._count("misses")
+            return None
+        if self._is_fresh(entry):
+            self._count(f"{tier}_hits")
+            return entry
+        max_stale = self.max_age if max_stale is None else max_stale
+        if max_stale is not None and entry.age > max_stale:
+            self._count("misses")
+            return None
+        self._count("stale_hits")
+        return entry
+
+    def get(self, key: str, default=None):
+        entry, tier = self._lookup(key)
+        if entry is None or not self._is_fresh(entry):
+            self._count("misses")
+            return default
+        self._count(f"{tier}_hits")
+        return entry.value
+
+    def set(self, key: str, value):
+        entry = CacheEntry(value)
+        self._remember(key, entry)
+        if self.disk is not None:
+            self._count("evictions", self.disk.set(key, entry))
+        self._count("sets")
+
+    def delete(self, key: str):
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def get_or_compute(self, key: str, compute):
+        """Fresh cached value, or compute() it once even under concurrent misses."""
+        entry, tier = self._lookup(key)
+        if entry is not None and self._is_fresh(entry):
+            self._count(f"{tier}_hits")
+            return entry.value
+
+        self._count("misses")
+        return self.refresh(key, compute)
+
+    def is_refreshing(self, key: str) -> bool:
+        with self._lock:
+            return key in self._inflight
+
+    def refresh(self, key: str, compute):
+        """
+        compute() a new value for key and store it. Concurrent refreshes of
+        the same key wait for the one already running instead of repeating it.
+        """
+        with self._lock:
+            pending = self._inflight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[key] = Future()
+
+        if not owner:
+            return pending.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            self.set(key, value)
+            pending.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._memory)
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        lookups = hits + counters["misses"] + counters["stale_hits"]
+        return {
+            "name": self.name,
+            **counters,
+            "hits": hits,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_size": size,
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "disk": self.disk is not None
+        }
+
+
+def clear_caches():
+    """Empty every TieredCache in this process (memory and disk tiers)."""
+    for cache in list(_CACHES.values()):
+        cache.clear()
+
+
+def get_cache_stats() -> dict:
+    """Stats of every TieredCache created in this process, by name."""
+    return {name: cache.stats() for name, cache in _CACHES.items()}
+
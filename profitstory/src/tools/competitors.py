@@ -1,63 +1,148 @@
 # src/tools/competitors.py
 from langchain_core.tools import tool
+from concurrent.futures import ThreadPoolExecutor, wait
 from .search import web_search_tool
 from .scraper import legal_web_scraper_tool
+import os
+import time
+
+DEFAULT_PLATFORMS = [
+    "amazon.in", "flipkart.com", "myntra.com",
+    "ajio.com", "bigbasket.com", "nykaa.com", "snapdeal.com"
+]
+
+# Overall time budget for one competitor lookup, in seconds
+COMPETITOR_DEADLINE_S = float(os.getenv("COMPETITOR_DEADLINE_S", "8"))
+
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def _discover_on_platform(product_query: str, platform: str, deadline: float = None) -> dict:
+    """
+    Search one platform, scrape its top hit; returns competitor (or None) and
+    status. Past `deadline` (a perf_counter value) the caller has moved on,
+    so the scrape is skipped.
+    """
+    start = time.perf_counter()
+
+    search_results = web_search_tool.invoke({
+        "input": {
+            "query": f"{product_query} site:{platform}",
+            "top_k": 2,
+            "domains": [platform]
+        }
+    })
+    if "error" in search_results:
+        return {"competitor": None, "status": "error",
+                "error": search_results["error"], "elapsed_ms": _elapsed_ms(start)}
+
+    results = search_results.get("results", [])[:1]  # Take first result per platform
+    if not results:
+        return {"competitor": None, "status": "no_results", "elapsed_ms": _elapsed_ms(start)}
+
+    result = results[0]
+    if deadline is not None and time.perf_counter() >= deadline:
+        return {"competitor": None, "status": "timeout", "elapsed_ms": _elapsed_ms(start)}
+    product_data = legal_web_scraper_tool.invoke({"input": {"url": result["url"]}})
+
+    if product_data.get("price"):
+        return {
+            "competitor": {
+                "title": product_data.get("title", result["title"]),
+                "price": product_data["price"],
+                "url": result["url"],
+                "platform": platform,
+                "brand": product_data.get("brand", "Unknown"),
+                "rating": None
+            },
+            "status": "ok",
+            "elapsed_ms": _elapsed_ms(start)
+        }
+
+    if not product_data.get("scrape_allowed", True):
+        status = "blocked"
+    elif product_data.get("error"):
+        status = "error"
+    else:
+        status = "no_price"
+    outcome = {"competitor": None, "status": status, "elapsed_ms": _elapsed_ms(start)}
+    if product_data.get("error"):
+        outcome["error"] = product_data["error"]
+    return outcome
+
 
 @tool
-def competitor_pricing_tool(product_query: str, platforms: list = None) -> dict:
+def competitor_pricing_tool(product_query: str, platforms: list = None, deadline_s: float = None) -> dict:
     """
     Search for competitor prices across Indian e-commerce platforms.
-    
+
+    Each platform's search + scrape runs concurrently, in threads of this
+    call only, so lookups abandoned at the deadline cannot hold up other
+    requests' platforms. Whatever has come back when the deadline hits is
+    returned; the rest are reported as timed out and skip their scrape.
+
     Args:
         product_query: Product search query
-        platforms: List of platforms to search
-    
+        platforms: List of platforms to search (defaults to all seven)
+        deadline_s: Overall time budget in seconds (COMPETITOR_DEADLINE_S)
+
     Returns:
-        dict with competitor pricing data
+        dict with competitor pricing data and per-platform status/timing
     """
-    
-    default_platforms = [
-        "amazon.in", "flipkart.com", "myntra.com", 
-        "ajio.com", "bigbasket.com", "nykaa.com", "snapdeal.com"
-    ]
-    
-    platforms_to_search = platforms or default_platforms
+
+    platforms_to_search = platforms or DEFAULT_PLATFORMS
+    deadline = COMPETITOR_DEADLINE_S if deadline_s is None else deadline_s
+    start = time.perf_counter()
+
+    pool = ThreadPoolExecutor(max_workers=len(platforms_to_search), thread_name_prefix="competitors")
+    try:
+        futures = {
+            platform: pool.submit(_discover_on_platform, product_query, platform, start + deadline)
+            for platform in platforms_to_search
+        }
+        _, pending = wait(futures.values(), timeout=deadline)
+    finally:
+        # don't wait for the stragglers; they stop at their next step
+        pool.shutdown(wait=False, cancel_futures=True)
+
     competitors = []
-    
-    # Search each platform
-    for platform in platforms_to_search[:3]:  # Limit to 3 platforms for demo
+    platform_status = {}
+    for platform, future in futures.items():
+        if future in pending:
+            future.cancel()
+            platform_status[platform] = {"status": "timeout", "elapsed_ms": _elapsed_ms(start)}
+            continue
         try:
-            search_results = web_search_tool(
-                query=f"{product_query} site:{platform}",
-                top_k=2
-            )
-            
-            for result in search_results["results"][:1]:  # Take first result per platform
-                # Scrape product page
-                product_data = legal_web_scraper_tool(result["url"])
-                
-                if product_data.get("price"):
-                    competitors.append({
-                        "title": product_data.get("title", result["title"]),
-                        "price": product_data["price"],
-                        "url": result["url"],
-                        "platform": platform,
-                        "brand": product_data.get("brand", "Unknown"),
-                        "rating": None
-                    })
+            outcome = future.result()
         except Exception as e:
+            platform_status[platform] = {"status": "error", "error": str(e), "elapsed_ms": _elapsed_ms(start)}
             continue
-    
+
+        competitor = outcome.pop("competitor")
+        if competitor is not None:
+            competitors.append(competitor)
+        platform_status[platform] = outcome
+
+    timing = {
+        "platform_status": platform_status,
+        "elapsed_ms": _elapsed_ms(start),
+        "deadline_s": deadline,
+        "timed_out": bool(pending)
+    }
+
     if not competitors:
-        # Return simulated data if scraping fails
         return {
             "competitors": [],
             "price_range": {"min": 0, "max": 0, "avg": 0},
-            "total_found": 0
+            "total_found": 0,
+            **timing
         }
-    
+
     prices = [c["price"] for c in competitors]
-    
+
     return {
         "competitors": competitors,
         "price_range": {
@@ -65,5 +150,6 @@ def competitor_pricing_tool(product_query: str, platforms: list = None) -> dict:
             "max": max(prices),
             "avg": sum(prices) / len(prices)
         },
-        "total_found": len(competitors)
+        "total_found": len(competitors),
+        **timing
     }
@@ -1,5 +1,20 @@
 # src/tools/experience.py
 from langchain_core.tools import tool
+from .keywords import KeywordMatcher
+
+PREMIUM_BRANDS = [
+    'forest essentials', 'fabindia', 'good earth', 'anita dongre',
+    'raw mango', 'sabyasachi', 'milton', 'borosil', 'cello'
+]
+
+PREMIUM_MATERIALS = [
+    'leather', 'silk', 'organic', 'handloom', 'khadi',
+    'pure cotton', 'cashmere', 'wool', 'stainless steel', 'brass'
+]
+
+BRAND_MATCHER = KeywordMatcher({"premium_brand": PREMIUM_BRANDS})
+MATERIAL_MATCHER = KeywordMatcher({"premium_material": PREMIUM_MATERIALS})
+
 
 @tool
 def experience_score_generator_tool(
@@ -22,24 +37,12 @@ def experience_score_generator_tool(
     """
     
     # Brand strength assessment
-    premium_brands = [
-        'forest essentials', 'fabindia', 'good earth', 'anita dongre',
-        'raw mango', 'sabyasachi', 'milton', 'borosil', 'cello'
-    ]
-    
     brand_lower = brand_name.lower()
-    brand_strength = 80 if any(pb in brand_lower for pb in premium_brands) else 50
+    brand_strength = 80 if BRAND_MATCHER.scan(brand_lower).any("premium_brand") else 50
     
     # Material premium assessment
-    premium_materials = [
-        'leather', 'silk', 'organic', 'handloom', 'khadi',
-        'pure cotton', 'cashmere', 'wool', 'stainless steel', 'brass'
-    ]
-    
     materials_str = ' '.join(materials).lower() if materials else ""
-    material_premium = min(100, sum(
-        20 for pm in premium_materials if pm in materials_str
-    ))
+    material_premium = min(100, 20 * MATERIAL_MATCHER.scan(materials_str).count("premium_material"))
     
     # Extract scores from narrative analysis
     story_strength = narrative_analysis.get("story_strength", 50)
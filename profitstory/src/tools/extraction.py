@@ -0,0 +1,196 @@
+# src/tools/extraction.py
+from urllib.parse import urlparse
+import os
+
+# ---------------- EXTRACTION TABLE ----------------
+# Domain marker (substring of the host) -> field -> CSS selector. Checked in
+# order; the first marker found in the host wins. Selectors are compiled once
+# per backend, not per page.
+
+EXTRACTION_RULES = {
+    "amazon": {
+        "title": "#productTitle",
+        "price": ".a-price-whole",
+        "description": "#feature-bullets",
+        "brand": "#bylineInfo",
+        "images": ".imageThumbnail img",
+    },
+    "flipkart": {
+        "title": "span.B_NuCI",
+        "price": "div._30jeq3",
+        "description": "div._1mXcCf",
+        "images": "img._396cs4",
+    },
+    "myntra": {
+        "title": "h1.pdp-title",
+        "price": "span.pdp-price",
+        "description": "div.pdp-product-description-content",
+        "images": "div.image-grid-image img",
+    },
+}
+
+TEXT_FIELDS = ("title", "description", "brand")
+MAX_IMAGES = 5
+
+
+def match_rules(url: str):
+    domain = urlparse(url).netloc
+    for marker, rules in EXTRACTION_RULES.items():
+        if marker in domain:
+            return marker
+    return None
+
+
+def _parse_price(text: str):
+    num = "".join(c for c in text if c.isdigit())
+    return float(num) if num else None
+
+
+# ---------------- BACKENDS ----------------
+
+class Bs4Backend:
+    """BeautifulSoup with the pure-Python html.parser (the original behaviour)."""
+
+    name = "html.parser"
+
+    def __init__(self, features: str = "html.parser"):
+        import soupsieve
+        from bs4 import BeautifulSoup
+
+        self.features = features
+        self._soup = BeautifulSoup
+        self._compiled = {
+            marker: {field: soupsieve.compile(selector) for field, selector in rules.items()}
+            for marker, rules in EXTRACTION_RULES.items()
+        }
+
+    def extract(self, html: str, marker: str) -> dict:
+        soup = self._soup(html, self.features)
+        selectors = self._compiled[marker]
+        data = {}
+
+        for field in TEXT_FIELDS:
+            if field in selectors:
+                node = selectors[field].select_one(soup)
+                data[field] = node.get_text(strip=True) if node else ""
+
+        price = selectors["price"].select_one(soup)
+        data["price"] = _parse_price(price.get_text()) if price else None
+
+        data["images"] = [img.get("src") for img in selectors["images"].select(soup)][:MAX_IMAGES]
+        return data
+
+
+class LxmlBackend:
+    """
+    lxml's C HTML parser with selectors precompiled to XPath. Text is
+    collected the way BeautifulSoup's get_text() does it (comments, <script>
+    and <style> contents skipped), so results match the html.parser backend.
+    """
+
+    name = "lxml"
+    SKIP_TEXT_TAGS = ("script", "style", "template")
+
+    def __init__(self):
+        import lxml.html
+        from lxml import etree
+        from cssselect import HTMLTranslator
+
+        self._document = lxml.html.document_fromstring
+        self._utf8_parser = lxml.html.HTMLParser(encoding="utf-8")
+        self._parser_error = etree.ParserError
+        translator = HTMLTranslator()
+        self._compiled = {
+            marker: {
+                field: etree.XPath(translator.css_to_xpath(selector))
+                for field, selector in rules.items()
+            }
+            for marker, rules in EXTRACTION_RULES.items()
+        }
+
+    def _strings(self, element):
+        if element.text and element.tag not in self.SKIP_TEXT_TAGS:
+            yield element.text
+        for child in element:
+            if isinstance(child.tag, str) and child.tag not in self.SKIP_TEXT_TAGS:
+                yield from self._strings(child)
+            if child.tail:
+                yield child.tail
+
+    def _text(self, element, strip: bool) -> str:
+        if strip:
+            return "".join(s.strip() for s in self._strings(element) if s.strip())
+        return "".join(self._strings(element))
+
+    def _parse(self, html: str):
+        try:
+            return self._document(html)
+        except ValueError:
+            # str input with an XML encoding declaration
+            return self._document(html.encode("utf-8"), parser=self._utf8_parser)
+
+    def extract(self, html: str, marker: str) -> dict:
+        try:
+            root = self._parse(html)
+        except self._parser_error:
+            return {}               # empty document: keep the defaults
+        selectors = self._compiled[marker]
+        data = {}
+
+        for field in TEXT_FIELDS:
+            if field in selectors:
+                nodes = selectors[field](root)
+                data[field] = self._text(nodes[0], strip=True) if nodes else ""
+
+        price = selectors["price"](root)
+        data["price"] = _parse_price(self._text(price[0], strip=False)) if price else None
+
+        data["images"] = [img.get("src") for img in selectors["images"](root)][:MAX_IMAGES]
+        return data
+
+
+_BACKENDS = {"lxml": LxmlBackend, "html.parser": Bs4Backend}
+_backend = None
+
+
+def create_backend(name: str = None):
+    """
+    Build an extraction backend. Without a name, SCRAPER_HTML_BACKEND decides;
+    by default lxml is used when installed, else html.parser.
+    """
+    name = name or os.getenv("SCRAPER_HTML_BACKEND")
+    if name:
+        return _BACKENDS[name]()
+    try:
+        return LxmlBackend()
+    except ImportError:
+        return Bs4Backend()
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        _backend = create_backend()
+    return _backend
+
+
+def set_backend(backend):
+    global _backend
+    _backend = backend
+
+
+def extract_product_data(html: str, url: str, backend=None) -> dict:
+    data = {
+        "title": "",
+        "description": "",
+        "brand": "",
+        "images": [],
+        "price": None,
+    }
+
+    marker = match_rules(url)
+    if marker is None:
+        return data
+
+    data.update((backend or get_backend()).extract(html, marker))
+    return data
@@ -0,0 +1,155 @@
+# src/tools/keywords.py
+from collections import deque
+
+
+class KeywordHits:
+    """Result of one KeywordMatcher.scan() over a text."""
+
+    def __init__(self, matcher: "KeywordMatcher", text: str, positions: dict):
+        self._matcher = matcher
+        self.text = text
+        self._positions = positions      # keyword -> sorted start offsets
+        self._by_category = None
+
+    def _categorise(self) -> dict:
+        if self._by_category is None:
+            by_category = {}
+            for keyword in self._positions:
+                for category, order in self._matcher._memberships[keyword]:
+                    by_category.setdefault(category, []).append((order, keyword))
+            self._by_category = {
+                category: [kw for _, kw in sorted(found)]
+                for category, found in by_category.items()
+            }
+        return self._by_category
+
+    def found(self, category: str) -> list:
+        """Keywords of `category` present in the text, in the category's list order."""
+        return self._categorise().get(category, [])
+
+    def any(self, category: str) -> bool:
+        return bool(self.found(category))
+
+    def count(self, category: str) -> int:
+        return len(self.found(category))
+
+    def positions(self, keyword: str) -> list:
+        """Start offsets of every (possibly overlapping) occurrence of `keyword`."""
+        return self._positions.get(keyword, [])
+
+    def snippet(self, keyword: str, before: int = 50, after: int = 50):
+        """
+        Context around the first occurrence of `keyword`, identical to
+        re.search(f".{{0,{before}}}{keyword}.{{0,{after}}}", text).group(0),
+        but computed from the match positions instead of a regex scan.
+        """
+        starts = self.positions(keyword)
+        if not starts:
+            return None
+
+        text = self.text
+        first = starts[0]
+        start = max(first - before, text.rfind("\n", 0, first) + 1)
+
+        # greedy prefix: the regex settles on the last occurrence it can reach
+        chosen = first
+        for p in starts:
+            if p > start + before:
+                break
+            if "\n" not in text[start:p]:
+                chosen = p
+
+        return text[start:_line_limited_end(text, chosen + len(keyword), after)]
+
+    def trailing_snippets(self, keyword: str, after: int = 80) -> list:
+        """
+        Non-overlapping `keyword` + up to `after` following characters, identical
+        to [m.group(0) for m in re.finditer(keyword + f".{{0,{after}}}", text)].
+        """
+        snippets = []
+        last_end = 0
+        for p in self.positions(keyword):
+            if p < last_end:
+                continue
+            end = _line_limited_end(self.text, p + len(keyword), after)
+            snippets.append(self.text[p:end])
+            last_end = end
+        return snippets
+
+
+def _line_limited_end(text: str, offset: int, width: int) -> int:
+    newline = text.find("\n", offset, offset + width)
+    return newline if newline != -1 else min(len(text), offset + width)
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over categorised keyword lists.
+
+    Built once (at import time in the tools) and then finds every occurrence
+    of every keyword in a single pass over the text, so scanning cost stays
+    linear in text length however long the keyword lists grow. Matching is
+    plain substring matching, same as `keyword in text`.
+    """
+
+    def __init__(self, categories: dict):
+        self.categories = {name: list(keywords) for name, keywords in categories.items()}
+
+        # keyword -> [(category, position in that category's list)]
+        self._memberships = {}
+        for name, keywords in self.categories.items():
+            for order, keyword in enumerate(keywords):
+                self._memberships.setdefault(keyword, []).append((name, order))
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        for keyword in self._memberships:
+            if keyword:
+                self._add(keyword)
+        self._link()
+
+    def _add(self, keyword: str):
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        self._out[node] = self._out[node] + (keyword,)
+
+    def _link(self):
+        pending = deque(self._goto[0].values())
+        while pending:
+            node = pending.popleft()
+            for ch, child in self._goto[node].items():
+                pending.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def iter_matches(self, text: str):
+        """Yield (start, end, keyword) for every occurrence, ordered by end offset."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for keyword in out[node]:
+                yield i + 1 - len(keyword), i + 1, keyword
+
+    def scan(self, text: str) -> KeywordHits:
+        positions = {}
+        for start, _, keyword in self.iter_matches(text):
+            positions.setdefault(keyword, []).append(start)
+        for starts in positions.values():
+            starts.sort()
+        return KeywordHits(self, text, positions)
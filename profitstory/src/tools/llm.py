@@ -0,0 +1,109 @@
+# src/tools/llm.py
+import os
+import threading
+
+DEFAULT_MODEL = "gemini-2.0-flash"
+
+
+class FakeLLMResponse:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class FakeLLM:
+    """
+    Deterministic offline stand-in for ChatGoogleGenerativeAI.
+
+    Only implements invoke(prompt) -> object with .content, which is all the
+    tools use. The reply is derived from the prompt, so identical prompts
+    always produce identical text.
+    """
+
+    def __init__(self, model: str = DEFAULT_MODEL, temperature: float = 0.0):
+        self.model = model
+        self.temperature = temperature
+        self.calls = 0
+
+    def invoke(self, prompt) -> FakeLLMResponse:
+        self.calls += 1
+        fields = {}
+        for line in str(prompt).splitlines():
+            key, sep, value = line.partition(":")
+            if sep and value.strip():
+                fields.setdefault(key.strip().lower(), value.strip())
+
+        product = fields.get("product", "this product")
+        brand = fields.get("brand", "the maker")
+        price = fields.get("price", "its price")
+        return FakeLLMResponse(
+            f"{product} by {brand} is made to be enjoyed every day. "
+            f"Careful craftsmanship and quality materials shape how it looks and feels. "
+            f"At {price}, it offers lasting value for the experience it delivers."
+        )
+
+
+def _gemini_factory(model: str, temperature: float):
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    return ChatGoogleGenerativeAI(
+        model=model,
+        google_api_key=os.getenv("GOOGLE_API_KEY"),
+        temperature=temperature
+    )
+
+
+def _fake_factory(model: str, temperature: float):
+    return FakeLLM(model=model, temperature=temperature)
+
+
+class LLMProvider:
+    """
+    Process-wide pool of chat model clients, one per (model, temperature).
+
+    Clients are created lazily on first request and then reused, so the
+    underlying Gemini transport (and its HTTP connections) is shared by all
+    callers instead of being set up per tool call.
+    """
+
+    def __init__(self, factory=None):
+        self._factory = factory or _gemini_factory
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, model: str = DEFAULT_MODEL, temperature: float = 0.7):
+        key = (model, float(temperature))
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._factory(model, temperature)
+                    self._clients[key] = client
+        return client
+
+    def set_factory(self, factory):
+        """Replace how clients are built (e.g. a local fake); drops pooled clients."""
+        with self._lock:
+            self._factory = factory
+            self._clients.clear()
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+
+_PROVIDER = LLMProvider(
+    factory=_fake_factory if os.getenv("PROFITSTORY_FAKE_LLM") == "1" else None
+)
+
+
+def get_llm(model: str = DEFAULT_MODEL, temperature: float = 0.7):
+    return _PROVIDER.get(model=model, temperature=temperature)
+
+
+def set_llm_factory(factory):
+    _PROVIDER.set_factory(factory)
+
+
+def use_fake_llm():
+    """Route every LLM call in the process to the deterministic FakeLLM."""
+    _PROVIDER.set_factory(_fake_factory)
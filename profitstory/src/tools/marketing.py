@@ -1,8 +1,44 @@
 # src/tools/marketing.py
 from langchain_core.tools import tool
-from langchain_google_genai import ChatGoogleGenerativeAI
+from .llm import get_llm, DEFAULT_MODEL
+from .cache import TieredCache, make_cache_key
+from ..observability.metrics import timed
 import os
 
+MARKETING_TEMPERATURE = 0.7
+
+# Same normalized inputs -> same prompt -> cached copy. Memory LRU always on,
+# SQLite tier only when MARKETING_CACHE_PATH is set.
+MARKETING_CACHE = TieredCache(
+    "marketing",
+    maxsize=int(os.getenv("MARKETING_CACHE_SIZE", "2048")),
+    ttl=float(os.getenv("MARKETING_CACHE_TTL", str(7 * 24 * 3600))),
+    path=os.getenv("MARKETING_CACHE_PATH") or None
+)
+
+
+def _normalize_text(value) -> str:
+    return " ".join(str(value or "").split())
+
+
+def _normalize_number(value):
+    value = round(float(value or 0), 2)
+    return int(value) if value.is_integer() else value
+
+
+def normalize_marketing_inputs(product_title, suggested_price, experience_score, luxury_signals,
+                               craftsmanship_score, story_strength, brand_name) -> dict:
+    return {
+        "product_title": _normalize_text(product_title),
+        "brand_name": _normalize_text(brand_name),
+        "suggested_price": _normalize_number(suggested_price),
+        "experience_score": _normalize_number(experience_score),
+        "craftsmanship_score": _normalize_number(craftsmanship_score),
+        "story_strength": _normalize_number(story_strength),
+        "luxury_signals": sorted({_normalize_text(s).lower() for s in luxury_signals or [] if s})
+    }
+
+
 @tool
 def marketing_justification_tool(
     product_title: str,
@@ -29,22 +65,30 @@ def marketing_justification_tool(
         str: Marketing justification text
     """
     
-    # Initialize Gemini model
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash",
-        google_api_key=os.getenv("GOOGLE_API_KEY"),
-        temperature=0.7
+    inputs = normalize_marketing_inputs(
+        product_title, suggested_price, experience_score, luxury_signals,
+        craftsmanship_score, story_strength, brand_name
     )
+    key = make_cache_key("marketing", DEFAULT_MODEL, MARKETING_TEMPERATURE, inputs)
+
+    return MARKETING_CACHE.get_or_compute(key, lambda: _generate_justification(inputs))
+
+
+def _generate_justification(inputs: dict) -> str:
+    luxury_signals = inputs["luxury_signals"]
+
+    # Shared Gemini client from the pool (created on first use)
+    llm = get_llm(model=DEFAULT_MODEL, temperature=MARKETING_TEMPERATURE)
     
     prompt = f"""Create a compelling 3-5 sentence marketing justification for this product's price.
 Focus on experience, craftsmanship, emotional value, and quality.
 
-Product: {product_title}
-Brand: {brand_name}
-Price: ₹{suggested_price}
-Experience Score: {experience_score}/100
-Craftsmanship Score: {craftsmanship_score}/100
-Story Strength: {story_strength}/100
+Product: {inputs["product_title"]}
+Brand: {inputs["brand_name"]}
+Price: ₹{inputs["suggested_price"]}
+Experience Score: {inputs["experience_score"]}/100
+Craftsmanship Score: {inputs["craftsmanship_score"]}/100
+Story Strength: {inputs["story_strength"]}/100
 Luxury Signals: {', '.join(luxury_signals) if luxury_signals else 'None'}
 
 Guidelines:
@@ -57,5 +101,6 @@ Guidelines:
 
 Write the justification:"""
     
-    response = llm.invoke(prompt)
+    with timed("llm"):
+        response = llm.invoke(prompt)
     return response.content.strip()
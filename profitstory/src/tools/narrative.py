@@ -1,13 +1,64 @@
 # src/tools/narrative.py
 from langchain_core.tools import tool
-from langchain_google_genai import ChatGoogleGenerativeAI
+from .keywords import KeywordMatcher
+from .llm import get_llm
+from ..observability.metrics import timed
 import os
-import re
+
+# Keyword scoring is always on; the Gemini narrative summary is opt-in
+NARRATIVE_LLM_MODE = os.getenv("NARRATIVE_LLM_MODE", "0") == "1"
+
+# Luxury and emotional keyword detection
+LUXURY_KEYWORDS = [
+    'handcrafted', 'artisan', 'bespoke', 'premium', 'exclusive',
+    'limited edition', 'heritage', 'luxury', 'elegant', 'sophisticated',
+    'finest', 'exquisite', 'curated', 'authentic', 'rare'
+]
+
+EMOTIONAL_KEYWORDS = [
+    'love', 'feel', 'experience', 'journey', 'story', 'passion',
+    'crafted with care', 'timeless', 'cherish', 'treasure', 'special',
+    'meaningful', 'beautiful', 'stunning', 'gorgeous'
+]
+
+CRAFTSMANSHIP_KEYWORDS = [
+    'handmade', 'hand-stitched', 'artisan', 'crafted', 'skilled',
+    'traditional', 'masterpiece', 'meticulously', 'attention to detail',
+    'precision', 'craftsmanship', 'artistry'
+]
+
+MATERIAL_QUALITY_KEYWORDS = [
+    'genuine leather', 'pure silk', 'organic cotton', '100%', 'natural',
+    'sustainable', 'premium materials', 'finest', 'quality',
+    'authentic', 'real', 'pure', 'organic', 'eco-friendly'
+]
+
+HERITAGE_KEYWORDS = [
+    'heritage', 'traditional', 'ancient', 'classic', 'vintage',
+    'time-honored', 'legacy', 'generations', 'cultural', 'historic'
+]
+
+SENSORY_KEYWORDS = [
+    'soft', 'smooth', 'rich', 'luxurious feel', 'texture',
+    'scent', 'aroma', 'fragrance', 'taste', 'touch', 'silky'
+]
+
+# One automaton over all six lists, built at import time
+NARRATIVE_MATCHER = KeywordMatcher({
+    "luxury": LUXURY_KEYWORDS,
+    "emotional": EMOTIONAL_KEYWORDS,
+    "craftsmanship": CRAFTSMANSHIP_KEYWORDS,
+    "material_quality": MATERIAL_QUALITY_KEYWORDS,
+    "heritage": HERITAGE_KEYWORDS,
+    "sensory": SENSORY_KEYWORDS,
+})
+
 
 @tool
 def product_narrative_analyzer_tool(description: str, title: str = "") -> dict:
     """
-    Analyze product description for emotional and luxury indicators using Gemini.
+    Analyze product description for emotional and luxury indicators.
+    With NARRATIVE_LLM_MODE=1, Gemini also adds a short narrative summary.
     
     Args:
         description: Product description text
@@ -17,57 +68,16 @@ def product_narrative_analyzer_tool(description: str, title: str = "") -> dict:
         dict with narrative analysis scores
     """
     
-    # Initialize Gemini model
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash",
-        google_api_key=os.getenv("GOOGLE_API_KEY"),
-        temperature=0.3
-    )
-    
-    # Luxury and emotional keyword detection
-    luxury_keywords = [
-        'handcrafted', 'artisan', 'bespoke', 'premium', 'exclusive',
-        'limited edition', 'heritage', 'luxury', 'elegant', 'sophisticated',
-        'finest', 'exquisite', 'curated', 'authentic', 'rare'
-    ]
-    
-    emotional_keywords = [
-        'love', 'feel', 'experience', 'journey', 'story', 'passion',
-        'crafted with care', 'timeless', 'cherish', 'treasure', 'special',
-        'meaningful', 'beautiful', 'stunning', 'gorgeous'
-    ]
-    
-    craftsmanship_keywords = [
-        'handmade', 'hand-stitched', 'artisan', 'crafted', 'skilled',
-        'traditional', 'masterpiece', 'meticulously', 'attention to detail',
-        'precision', 'craftsmanship', 'artistry'
-    ]
-    
-    material_quality_keywords = [
-        'genuine leather', 'pure silk', 'organic cotton', '100%', 'natural',
-        'sustainable', 'premium materials', 'finest', 'quality',
-        'authentic', 'real', 'pure', 'organic', 'eco-friendly'
-    ]
-    
-    heritage_keywords = [
-        'heritage', 'traditional', 'ancient', 'classic', 'vintage',
-        'time-honored', 'legacy', 'generations', 'cultural', 'historic'
-    ]
-    
-    sensory_keywords = [
-        'soft', 'smooth', 'rich', 'luxurious feel', 'texture',
-        'scent', 'aroma', 'fragrance', 'taste', 'touch', 'silky'
-    ]
-    
     text = (title + " " + description).lower()
     
-    # Find matches
-    luxury_found = [kw for kw in luxury_keywords if kw in text]
-    emotional_found = [kw for kw in emotional_keywords if kw in text]
-    craftsmanship_found = [kw for kw in craftsmanship_keywords if kw in text]
-    material_found = [kw for kw in material_quality_keywords if kw in text]
-    heritage_found = [kw for kw in heritage_keywords if kw in text]
-    sensory_found = [kw for kw in sensory_keywords if kw in text]
+    # Find matches (single pass over the text for every category)
+    hits = NARRATIVE_MATCHER.scan(text)
+    luxury_found = hits.found("luxury")
+    emotional_found = hits.found("emotional")
+    craftsmanship_found = hits.found("craftsmanship")
+    material_found = hits.found("material_quality")
+    heritage_found = hits.found("heritage")
+    sensory_found = hits.found("sensory")
     
     # Calculate scores
     luxury_score = min(100, len(luxury_found) * 15)
@@ -83,7 +93,7 @@ def product_narrative_analyzer_tool(description: str, title: str = "") -> dict:
         material_quality_score * 0.20
     )
     
-    return {
+    result = {
         "story_strength": round(story_strength, 2),
         "luxury_signals": luxury_found,
         "emotional_words": emotional_found,
@@ -93,3 +103,15 @@ def product_narrative_analyzer_tool(description: str, title: str = "") -> dict:
         "sensory_keywords": sensory_found,
         "experience_keywords": list(set(luxury_found + emotional_found))
     }
+
+    if NARRATIVE_LLM_MODE:
+        # Pooled client, only requested when the LLM mode is enabled
+        llm = get_llm(temperature=0.3)
+        with timed("llm"):
+            response = llm.invoke(
+                "Summarize in one sentence the story and experience this product "
+                f"description conveys.\n\nTitle: {title}\nDescription: {description}"
+            )
+        result["narrative_summary"] = response.content.strip()
+
+    return result
@@ -0,0 +1,278 @@
+# src/tools/pricing_engine.py
+import statistics
+import numpy as np
+
+# Defaults for missing signals; same as pricing_engine_tool has always used
+DEFAULTS = {
+    "market_baseline": 500,
+    "experience_score": 50,
+    "trend_boost_score": 10,
+    "brand_strength": 0,
+    "craftsmanship_score": 0,
+}
+
+FALLBACK_BASELINE = 999         # used when market_baseline <= 0 and no competitors
+COMPETITOR_BOOST = 0.12
+
+CONFIDENCE_LEVELS = np.array(["low", "medium", "high"])
+PRICE_POSITIONS = np.array(["estimated", "below_market", "competitive", "above_market"])
+
+
+# ---------------- COMPETITOR COLUMNS ----------------
+
+def _ragged(competitor_prices, competitor_counts, n: int):
+    """
+    Flatten competitor prices to (values, counts). Accepts either one list
+    per row, or an already flat array plus per-row counts.
+    """
+    if competitor_prices is None:
+        return np.zeros(0), np.zeros(n, dtype=np.int64)
+
+    if competitor_counts is None:
+        counts = np.fromiter((len(p) for p in competitor_prices), dtype=np.int64, count=n)
+        flat = [price for prices in competitor_prices for price in prices]
+        values = np.asarray(flat, dtype=np.float64)
+    else:
+        counts = np.asarray(competitor_counts, dtype=np.int64)
+        values = np.asarray(competitor_prices, dtype=np.float64)
+
+    if counts.shape != (n,) or counts.sum() != values.size:
+        raise ValueError("competitor prices do not line up with the catalogue rows")
+    return values, counts
+
+
+# Exact segment means need every price in a row as an integer multiple of
+# one power of two, and the row sum in an int64: rows whose prices span too
+# many binary orders of magnitude (under 1 rupee next to thousands), or with
+# EXACT_MEAN_MAX_COUNT competitors or more, use statistics.mean instead.
+EXACT_MEAN_MAX_COUNT = 256
+
+
+def _bit_length(x):
+    """Bit length of non-negative int64s (via frexp; exact below 2**53, else may be 1 high)."""
+    return np.frexp(x.astype(np.float64))[1].astype(np.int64)
+
+
+def _exact_means(values, starts, counts):
+    """
+    Correctly rounded means of the segments values[starts[i]:starts[i] + counts[i]],
+    as statistics.mean gives, without Python arithmetic per row.
+
+    Each float is split into integer mantissa and exponent; a segment is
+    rescaled to a common power of two (its lowest set bit) and summed in
+    int64, then divided in integers to a 53-bit quotient rounded half to
+    even. Returns (means, fits); rows with fits False were not computed.
+    """
+    n = counts.astype(np.int64)
+    mantissa, exponent = np.frexp(values)
+    ints = (mantissa * 2.0 ** 53).astype(np.int64)           # value == ints * 2**(exponent - 53)
+    trailing = np.frexp(ints & -ints)[1] - 1                  # lowest set bit
+    unit = np.where(ints == 0, 1 << 20, exponent - 53 + trailing)
+
+    scale = -np.minimum.reduceat(unit, starts)                # row sums are integers in units 2**-scale
+    top = np.maximum.reduceat(np.where(ints == 0, -(1 << 20), exponent), starts)
+    fits = (top + scale + _bit_length(n) <= 62) & (n < EXACT_MEAN_MAX_COUNT)
+
+    shift = np.clip(unit + np.repeat(np.where(fits, scale, 0), counts), 0, 62)
+    totals = np.add.reduceat(np.left_shift(ints >> np.maximum(trailing, 0), shift), starts)
+    sign, totals = np.sign(totals), np.abs(totals)
+
+    # quotient of totals * 2**t / n with exactly 53 bits; t starts as an
+    # estimate from the bit lengths and is corrected by a bit or two
+    t = np.where(fits, 53 - _bit_length(totals) + _bit_length(n) - 1, 0)
+    settled = ~fits | (totals == 0)
+    for _ in range(4):
+        num = np.left_shift(totals, np.maximum(t, 0))
+        den = np.left_shift(n, np.maximum(-t, 0))
+        quotient = num // den
+        high, low = ~settled & (quotient >= 1 << 53), ~settled & (quotient < 1 << 52)
+        if not (high.any() or low.any()):
+            break
+        t = t - high + low
+    remainder = num - quotient * den
+    round_up = (remainder > den - remainder) | ((remainder == den - remainder) & (quotient % 2 == 1))
+
+    means = sign * np.ldexp((quotient + round_up).astype(np.float64), -(t + scale))
+    return np.where(fits, means, 0.0), fits
+
+
+def _segment_means(values, counts):
+    """Per-row mean of the ragged competitor prices (0 where a row has none)."""
+    n = counts.size
+    means = np.zeros(n)
+    has = counts > 0
+    if not has.any():
+        return means
+
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    sums = np.add.reduceat(values, starts[has])
+    means[has] = sums / counts[has]
+
+    # Whole-rupee prices sum exactly in float64 (below 2**53), so sum / n is
+    # already the correctly rounded mean, same as statistics.mean. Rows with
+    # fractional prices are recomputed exactly in integers (_exact_means).
+    inexact = (np.add.reduceat(values != np.floor(values), starts[has]) > 0) | \
+              (np.add.reduceat(np.abs(values), starts[has]) >= 2.0 ** 53)
+    if inexact.any():
+        rows = np.flatnonzero(has)[inexact]
+        selected = np.zeros(n, dtype=bool)
+        selected[rows] = True
+        row_starts = np.concatenate(([0], np.cumsum(counts[rows])[:-1]))
+        means[rows], fits = _exact_means(values[np.repeat(selected, counts)], row_starts, counts[rows])
+        for row in rows[~fits]:
+            start = starts[row]
+            means[row] = statistics.mean(values[start:start + counts[row]].tolist())
+    return means
+
+
+# ---------------- ENGINE ----------------
+
+def price_catalogue(market_baseline=None, experience_score=None, trend_boost_score=None,
+                    brand_strength=None, craftsmanship_score=None,
+                    competitor_prices=None, competitor_counts=None, size: int = None) -> dict:
+    """
+    Price a whole catalogue in one NumPy pass.
+
+    Every signal is a column (array-like, one value per SKU) or None for the
+    default. competitor_prices is ragged: a list of per-SKU price lists, or a
+    flat array together with competitor_counts. Returns a dict of columns;
+    use to_records() for the per-product dicts pricing_engine_tool returns.
+    """
+    columns = {
+        "market_baseline": market_baseline,
+        "experience_score": experience_score,
+        "trend_boost_score": trend_boost_score,
+        "brand_strength": brand_strength,
+        "craftsmanship_score": craftsmanship_score,
+    }
+    if size is None:
+        given = [c for c in columns.values() if c is not None]
+        if given:
+            size = len(given[0])
+        elif competitor_counts is not None:
+            size = len(competitor_counts)
+        else:
+            size = 0 if competitor_prices is None else len(competitor_prices)
+
+    cols = {
+        name: (np.full(size, DEFAULTS[name], dtype=np.float64) if col is None
+               else np.asarray(col, dtype=np.float64))
+        for name, col in columns.items()
+    }
+    for name, col in cols.items():
+        if col.shape != (size,):
+            raise ValueError(f"{name} has shape {col.shape}, expected ({size},)")
+
+    experience = cols["experience_score"]
+    trend = cols["trend_boost_score"]
+    brand_strength = cols["brand_strength"]
+    market = cols["market_baseline"]
+
+    values, counts = _ragged(competitor_prices, competitor_counts, size)
+    has_competitors = counts > 0
+    competitor_avg = _segment_means(values, counts)
+
+    # Competitor average is the baseline when known; else market baseline,
+    # with a higher fallback for missing/zero baselines
+    baseline = np.where(
+        has_competitors,
+        competitor_avg,
+        np.where(market <= 0, float(FALLBACK_BASELINE), market)
+    )
+    competitor_adjustment = np.where(has_competitors, competitor_avg * COMPETITOR_BOOST, 0.0)
+
+    # Same operation order as the scalar formula, so float results are identical
+    experience_premium = (experience / 100) * (baseline * 0.4)
+    brand_bonus = (brand_strength / 100) * (baseline * 0.25)
+    craftsmanship_bonus = cols["craftsmanship_score"] * 10
+    trend_boost = (trend / 100) * (baseline * 0.25)
+
+    pre_multiplier_price = (
+        baseline
+        + experience_premium
+        + trend_boost
+        + competitor_adjustment
+        + brand_bonus
+        + craftsmanship_bonus
+    )
+
+    # Dynamic multiplier (max 10x); NaN scores fall through to the top tier
+    # just as the if/elif chain does
+    multiplier = np.select(
+        [experience < 40, experience < 70, experience < 90], [3, 5, 7], default=10
+    ).astype(np.int64)
+
+    suggested_price = np.trunc(pre_multiplier_price * multiplier)
+
+    # Confidence model
+    score = (
+        np.select([counts >= 3, counts >= 1], [40, 25], default=10)
+        + np.select([experience >= 70, experience >= 50], [30, 20], default=10)
+        + np.select([trend >= 50, trend >= 20], [20, 10], default=5)
+        + np.select([brand_strength >= 60, brand_strength >= 20], [10, 5], default=0)
+    )
+    confidence = np.select([score >= 80, score >= 50], [2, 1], default=0)
+
+    # Market position against the competitor average
+    position = np.select(
+        [~has_competitors,
+         suggested_price < competitor_avg * 0.9,
+         suggested_price > competitor_avg * 1.2],
+        [0, 1, 3], default=2
+    )
+
+    return {
+        "suggested_price": suggested_price,
+        "market_baseline": baseline,
+        "experience_premium": experience_premium,
+        "trend_boost": trend_boost,
+        "competitor_adjustment": competitor_adjustment,
+        "brand_bonus": brand_bonus,
+        "craftsmanship_bonus": craftsmanship_bonus,
+        "dynamic_multiplier": multiplier,
+        "pre_multiplier_price": pre_multiplier_price,
+        "confidence_score": score,
+        "confidence_level": CONFIDENCE_LEVELS[confidence],
+        "price_position": PRICE_POSITIONS[position],
+    }
+
+
+def _whole(value: float):
+    # the scalar tool passed these through from int inputs (defaults, the 999
+    # fallback, craftsmanship * 10), so whole values stay ints in the JSON
+    return int(value) if float(value).is_integer() else value
+
+
+def to_records(result: dict) -> list:
+    """Per-product dicts in the shape pricing_engine_tool has always returned."""
+    columns = {name: col.tolist() for name, col in result.items()}
+    return [
+        {
+            "suggested_price": int(columns["suggested_price"][i]),
+            "market_baseline": _whole(columns["market_baseline"][i]),
+            "experience_premium": round(columns["experience_premium"][i], 2),
+            "trend_boost": round(columns["trend_boost"][i], 2),
+            "competitor_adjustment": round(columns["competitor_adjustment"][i], 2),
+            "brand_bonus": round(columns["brand_bonus"][i], 2),
+            "craftsmanship_bonus": _whole(columns["craftsmanship_bonus"][i]),
+            "dynamic_multiplier": columns["dynamic_multiplier"][i],
+            "pre_multiplier_price": int(columns["pre_multiplier_price"][i]),
+            "confidence_level": columns["confidence_level"][i],
+            "price_position": columns["price_position"][i],
+        }
+        for i in range(len(columns["suggested_price"]))
+    ]
+
+
+def price_products(inputs: list) -> list:
+    """Price a list of pricing_engine_tool input dicts in one pass."""
+    columns = {
+        name: [row.get(name, default) for row in inputs]
+        for name, default in DEFAULTS.items()
+    }
+    result = price_catalogue(
+        **columns,
+        competitor_prices=[row.get("competitor_prices") or [] for row in inputs],
+        size=len(inputs)
+    )
+    return to_records(result)
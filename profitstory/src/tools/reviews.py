@@ -1,7 +1,28 @@
 # src/tools/reviews.py
 from langchain_core.tools import tool
-from transformers import pipeline
-import re
+from .sentiment import score_sentiments
+from .keywords import KeywordMatcher
+
+POSITIVE_KEYWORDS = ['love', 'amazing', 'excellent', 'perfect', 'best',
+                     'great', 'wonderful', 'beautiful', 'quality']
+NEGATIVE_KEYWORDS = ['disappointed', 'poor', 'bad', 'waste', 'terrible',
+                     'cheap', 'fake', 'worst', 'defective']
+REQUEST_PHRASES = [
+    'wish it had', 'would be better if', 'should have',
+    'needs', 'could improve', 'missing'
+]
+PRICE_MENTION_WORDS = ["price", "cost", "expensive", "cheap", "value"]
+PRICE_POSITIVE_WORDS = ["worth", "value", "reasonable", "fair"]
+
+# All review categories share one automaton: one pass per review
+REVIEW_MATCHER = KeywordMatcher({
+    "positive": POSITIVE_KEYWORDS,
+    "negative": NEGATIVE_KEYWORDS,
+    "request": REQUEST_PHRASES,
+    "price_mention": PRICE_MENTION_WORDS,
+    "price_positive": PRICE_POSITIVE_WORDS,
+})
+
 
 @tool
 def review_intelligence_tool(input: dict) -> dict:
@@ -11,12 +32,14 @@ def review_intelligence_tool(input: dict) -> dict:
     Expected input:
     {
         "reviews": [...],
-        "max_reviews": 50
+        "max_reviews": 50,
+        "batch_size": 16          # optional, model batch size
     }
     """
 
     reviews = input.get("reviews", [])
     max_reviews = input.get("max_reviews", 50)
+    batch_size = input.get("batch_size")
 
     if not reviews:
         return {
@@ -26,60 +49,35 @@ def review_intelligence_tool(input: dict) -> dict:
             "feature_requests": []
         }
 
-    sentiment_analyzer = pipeline(
-        "sentiment-analysis",
-        model="distilbert-base-uncased-finetuned-sst-2-english"
-    )
+    # One batched pass through the shared model for all reviews
+    sentiments = score_sentiments(reviews[:max_reviews], batch_size=batch_size)
 
-    sentiments = []
     love_patterns = []
     complaint_patterns = []
     feature_requests = []
 
-    positive_keywords = ['love', 'amazing', 'excellent', 'perfect', 'best',
-                         'great', 'wonderful', 'beautiful', 'quality']
-    negative_keywords = ['disappointed', 'poor', 'bad', 'waste', 'terrible',
-                         'cheap', 'fake', 'worst', 'defective']
-    request_patterns = [
-        r'wish it had', r'would be better if', r'should have',
-        r'needs', r'could improve', r'missing'
-    ]
-
-    for review in reviews[:max_reviews]:
-        sentiment = sentiment_analyzer(str(review)[:512])[0]
-        sentiments.append(1.0 if sentiment['label'] == 'POSITIVE' else 0.0)
+    review_hits = [REVIEW_MATCHER.scan(str(review).lower()) for review in reviews]
 
-        rev = str(review).lower()
+    for hits in review_hits[:max_reviews]:
 
-        # positive patterns
-        for kw in positive_keywords:
-            if kw in rev:
-                match = re.search(f".{{0,50}}{kw}.{{0,50}}", rev)
-                if match:
-                    love_patterns.append(match.group(0).strip())
+        # positive patterns (up to 50 chars of context either side)
+        for kw in hits.found("positive"):
+            love_patterns.append(hits.snippet(kw).strip())
 
         # negative patterns
-        for kw in negative_keywords:
-            if kw in rev:
-                match = re.search(f".{{0,50}}{kw}.{{0,50}}", rev)
-                if match:
-                    complaint_patterns.append(match.group(0).strip())
-
-        # feature request patterns
-        for pattern in request_patterns:
-            matches = re.finditer(pattern + r".{0,80}", rev)
-            for m in matches:
-                feature_requests.append(m.group(0).strip())
+        for kw in hits.found("negative"):
+            complaint_patterns.append(hits.snippet(kw).strip())
+
+        # feature request patterns (phrase + up to 80 following chars)
+        for phrase in hits.found("request"):
+            for snippet in hits.trailing_snippets(phrase, after=80):
+                feature_requests.append(snippet.strip())
 
     # price perception
-    price_mentions = [r for r in reviews if any(
-        w in str(r).lower() for w in ["price", "cost", "expensive", "cheap", "value"]
-    )]
+    price_mentions = [hits for hits in review_hits if hits.any("price_mention")]
 
     price_positive = sum(
-        1 for r in price_mentions if any(
-            w in str(r).lower() for w in ["worth", "value", "reasonable", "fair"]
-        )
+        1 for hits in price_mentions if hits.any("price_positive")
     )
 
     if len(price_mentions) == 0:
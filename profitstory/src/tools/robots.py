@@ -0,0 +1,103 @@
+# src/tools/robots.py
+from urllib.robotparser import RobotFileParser
+from .cache import TieredCache, cache_path
+import asyncio
+import os
+import threading
+
+ROBOTS_CACHE_TTL = float(os.getenv("ROBOTS_CACHE_TTL", str(24 * 3600)))
+
+# Raw robots.txt per site ({"status": ..., "text": ...}), persisted so that a
+# restart does not re-download robots.txt for every marketplace.
+ROBOTS_CACHE = TieredCache(
+    "robots",
+    maxsize=1024,
+    ttl=ROBOTS_CACHE_TTL,
+    path=cache_path("ROBOTS_CACHE_PATH", "robots.sqlite")
+)
+
+
+def build_robot_parser(record: dict) -> RobotFileParser:
+    rp = RobotFileParser()
+    # same status handling as RobotFileParser.read()
+    if record["status"] in (401, 403):
+        rp.disallow_all = True
+    elif record["status"] >= 400:
+        rp.allow_all = True
+    else:
+        rp.parse(record["text"].splitlines())
+    return rp
+
+
+class RobotsCache:
+    """
+    Process-wide robots.txt cache. Each site's robots.txt is fetched at most
+    once per TTL (concurrent lookups share the fetch); parsed rules are
+    kept in memory and the raw file in the TieredCache disk tier.
+
+    Fetchers return {"status": int, "text": str}, or raise when robots.txt
+    is unreachable. Unreachable sites count as allowed and are not cached,
+    so the next lookup tries again.
+    """
+
+    def __init__(self, cache: TieredCache = ROBOTS_CACHE):
+        self.cache = cache
+        self._parsers = {}          # base_url -> (stored_at, RobotFileParser)
+        self._lock = threading.Lock()
+        self._async_locks = {}
+
+    def _cached_parser(self, base_url: str):
+        # expired robots.txt is refetched, not served stale
+        entry = self.cache.get_entry(base_url, max_stale=self.cache.ttl)
+        if entry is None:
+            return None
+
+        with self._lock:
+            parsed = self._parsers.get(base_url)
+            if parsed is None or parsed[0] != entry.stored_at:
+                parsed = self._parsers[base_url] = (entry.stored_at, build_robot_parser(entry.value))
+        return parsed[1]
+
+    def get_parser(self, base_url: str, fetch):
+        """Parser for base_url, calling fetch(base_url) only when the cache is cold."""
+        rp = self._cached_parser(base_url)
+        if rp is not None:
+            return rp
+        try:
+            self.cache.refresh(base_url, lambda: fetch(base_url))
+        except Exception:
+            return None
+        return self._cached_parser(base_url)
+
+    async def get_parser_async(self, base_url: str, fetch):
+        """Async variant for the scrape engine loop; fetch is a coroutine function."""
+        rp = self._cached_parser(base_url)
+        if rp is not None:
+            return rp
+
+        lock = self._async_locks.setdefault(base_url, asyncio.Lock())
+        async with lock:
+            rp = self._cached_parser(base_url)
+            if rp is not None:
+                return rp
+            try:
+                record = await fetch(base_url)
+            except Exception:
+                return None
+            self.cache.set(base_url, record)
+            return self._cached_parser(base_url)
+
+    def can_fetch(self, base_url: str, url: str, user_agent: str, fetch) -> bool:
+        rp = self.get_parser(base_url, fetch)
+        return True if rp is None else rp.can_fetch(user_agent, url)
+
+    async def can_fetch_async(self, base_url: str, url: str, user_agent: str, fetch) -> bool:
+        rp = await self.get_parser_async(base_url, fetch)
+        return True if rp is None else rp.can_fetch(user_agent, url)
+
+
+_ROBOTS = RobotsCache()
+
+
+def get_robots_cache() -> RobotsCache:
+    return _ROBOTS
@@ -0,0 +1,240 @@
+# src/tools/scrape_engine.py
+from urllib.parse import urlparse, urljoin
+from .robots import get_robots_cache
+from ..observability.metrics import timed
+import asyncio
+import copy
+import os
+import threading
+import time
+
+USER_AGENT = "ProfitStoryAI-PricingBot/1.0"
+
+# (requests per second, burst) per domain. The marketplaces keep the old
+# one-request-per-1.5s spacing; other hosts get SCRAPER_DEFAULT_RATE.
+POLITENESS = {
+    "amazon.in": (1 / 1.5, 1),
+    "flipkart.com": (1 / 1.5, 1),
+    "myntra.com": (1 / 1.5, 1),
+}
+DEFAULT_POLITENESS = (float(os.getenv("SCRAPER_DEFAULT_RATE", "1.0")), 1)
+
+PAGE_TIMEOUT = 10
+
+
+def rate_limit_key(host: str) -> str:
+    """Politeness domain for a host: www.amazon.in and amazon.in share a bucket."""
+    host = host.lower().split(":")[0]
+    for domain in POLITENESS:
+        if host == domain or host.endswith("." + domain):
+            return domain
+    return host[4:] if host.startswith("www.") else host
+
+
+# ---------------- RATE LIMITING ----------------
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, at most `capacity` banked."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = None
+
+    async def acquire(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class DomainRateLimiter:
+    def __init__(self, politeness: dict = None, default: tuple = DEFAULT_POLITENESS):
+        self.politeness = dict(POLITENESS if politeness is None else politeness)
+        self.default = default
+        self._buckets = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        key = rate_limit_key(urlparse(url).netloc)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate, burst = self.politeness.get(key, self.default)
+            bucket = self._buckets[key] = TokenBucket(rate, burst)
+        return bucket
+
+    async def acquire(self, url: str):
+        await self.bucket(url).acquire()
+
+
+# ---------------- ENGINE ----------------
+
+class AsyncScrapeEngine:
+    """
+    asyncio scraper shared by the whole process.
+
+    It runs on its own event loop in a daemon thread, so synchronous callers
+    (LangChain tools, graph nodes) can use it and still share one pooled
+    httpx client: keep-alive connections are reused per host across calls.
+    Each domain is throttled by its own token bucket, so fetches to
+    different domains run concurrently while each marketplace still sees
+    polite spacing.
+    """
+
+    def __init__(self, extract, limiter: DomainRateLimiter = None, page_cache=None,
+                 max_connections: int = 100, max_keepalive: int = 20, transport=None):
+        self.extract = extract
+        self.limiter = limiter or DomainRateLimiter()
+        # url -> {"product", "etag", "last_modified"} for conditional GETs
+        self.page_cache = page_cache
+        self.revalidation_stats = {"not_modified": 0, "modified": 0}
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        # optional httpx transport (e.g. to route requests to a local fixture server)
+        self.transport = transport
+
+        self.robots = get_robots_cache()
+
+        self._client = None
+        self._loop = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    # ---- loop management ----
+
+    def _ensure_loop(self):
+        if self._loop is None:
+            with self._start_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._thread = threading.Thread(
+                        target=loop.run_forever, name="scrape-engine", daemon=True
+                    )
+                    self._thread.start()
+                    self._loop = loop
+        return self._loop
+
+    def run(self, coro, timeout: float = None):
+        """Run a coroutine on the engine loop from any (non-loop) thread."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        return future.result(timeout)
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True,
+                timeout=PAGE_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive
+                ),
+                transport=self.transport
+            )
+        return self._client
+
+    # ---- robots.txt ----
+
+    async def _fetch_robots(self, base_url: str) -> dict:
+        with timed("robots_fetch"):
+            response = await self._get_client().get(urljoin(base_url, "/robots.txt"))
+        return {"status": response.status_code, "text": response.text}
+
+    async def can_fetch(self, url: str) -> bool:
+        parsed = urlparse(url)
+        base_url = f"{parsed.scheme}://{parsed.netloc}"
+        return await self.robots.can_fetch_async(base_url, url, USER_AGENT, self._fetch_robots)
+
+    # ---- scraping ----
+
+    async def fetch(self, url: str, headers: dict = None, rate_limited: bool = False):
+        if not rate_limited:
+            await self.limiter.acquire(url)
+        with timed("page_fetch"):
+            response = await self._get_client().get(url, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+        return response
+
+    def _conditional_headers(self, cached: dict) -> dict:
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+
+    async def _fetch_product(self, url: str) -> dict:
+        """Fetch and extract a page, revalidating a cached copy when we have one."""
+        cached = self.page_cache.get(url) if self.page_cache is not None else None
+        response = await self.fetch(url, headers=self._conditional_headers(cached), rate_limited=True)
+
+        if response.status_code == 304 and cached:
+            self.revalidation_stats["not_modified"] += 1
+            return copy.deepcopy(cached["product"])
+
+        # parsing is CPU-bound: keep it off the event loop
+        product = await asyncio.to_thread(self.extract, response.text, url)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.page_cache is not None and (etag or last_modified):
+            if cached:
+                self.revalidation_stats["modified"] += 1
+            self.page_cache.set(url, {
+                "product": copy.deepcopy(product),
+                "etag": etag,
+                "last_modified": last_modified
+            })
+        return product
+
+    async def scrape(self, url: str) -> dict:
+        # robots.txt (usually a cache hit) is resolved while we wait for the
+        # domain's rate-limit slot; on a cold cache the robots request also
+        # opens the keep-alive connection the page request then reuses. The
+        # page itself is only requested once robots.txt allows it.
+        slot = asyncio.ensure_future(self.limiter.acquire(url))
+        try:
+            allowed = await self.can_fetch(url)
+        except BaseException:
+            slot.cancel()
+            raise
+
+        if not allowed:
+            slot.cancel()
+            return {"scrape_allowed": False, "error": "Blocked by robots.txt", "url": url}
+
+        try:
+            await slot
+            product = await self._fetch_product(url)
+            product["scrape_allowed"] = True
+            product["url"] = url
+            return product
+
+        except Exception as e:
+            return {
+                "scrape_allowed": True,
+                "error": f"Scrape failed: {str(e)}",
+                "url": url
+            }
+
+    async def scrape_many(self, urls: list) -> list:
+        return await asyncio.gather(*(self.scrape(url) for url in urls))
+
+    # ---- sync entry points ----
+
+    def scrape_url(self, url: str) -> dict:
+        return self.run(self.scrape(url))
+
+    def scrape_urls(self, urls: list) -> list:
+        return self.run(self.scrape_many(urls))
@@ -1,45 +1,81 @@
 # src/tools/search.py
 from langchain_core.tools import tool
-from tavily import TavilyClient
+from concurrent.futures import ThreadPoolExecutor
+from .cache import TieredCache, make_cache_key, cache_path
+from ..observability.metrics import timed
 import os
+import threading
 
-@tool
-def web_search_tool(input: dict) -> dict:
-    """
-    Legal web search for Indian e-commerce products.
-    
-    Expected input:
-        {
-            "query": "water bottle",
-            "top_k": 10
-        }
-    """
+DEFAULT_DOMAINS = [
+    "amazon.in", "flipkart.com", "myntra.com", "ajio.com",
+    "bigbasket.com", "nykaa.com", "snapdeal.com"
+]
 
-    query = input.get("query", "")
-    top_k = input.get("top_k", 10)
+# Fresh for SEARCH_CACHE_TTL; after that, served stale (and refreshed in the
+# background) until SEARCH_CACHE_STALE_TTL, then fetched synchronously.
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "3600"))
+SEARCH_CACHE_STALE_TTL = float(os.getenv("SEARCH_CACHE_STALE_TTL", str(24 * 3600)))
 
-    if not query:
-        return {"error": "Query is missing"}
+SEARCH_CACHE = TieredCache(
+    "search",
+    maxsize=int(os.getenv("SEARCH_CACHE_SIZE", "4096")),
+    ttl=SEARCH_CACHE_TTL,
+    path=cache_path("SEARCH_CACHE_PATH", "search.sqlite"),
+    max_disk_entries=int(os.getenv("SEARCH_CACHE_MAX_DISK_ENTRIES", "100000")),
+    # stale entries are still served until SEARCH_CACHE_STALE_TTL
+    max_age=SEARCH_CACHE_STALE_TTL
+)
 
-    client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
+_refresh_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-refresh")
 
-    enhanced_query = (
-        f"{query} site:amazon.in OR site:flipkart.com OR site:myntra.com OR "
-        f"site:ajio.com OR site:bigbasket.com OR site:nykaa.com OR site:snapdeal.com"
-    )
 
-    try:
-        response = client.search(
+# ---------------- BACKENDS ----------------
+
+class TavilySearchBackend:
+    """Tavily search; one client per process, created on first search."""
+
+    def __init__(self, api_key: str = None):
+        self.api_key = api_key
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _get_client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    from tavily import TavilyClient
+                    self._client = TavilyClient(api_key=self.api_key or os.getenv("TAVILY_API_KEY"))
+        return self._client
+
+    def search(self, query: str, top_k: int, domains: list) -> dict:
+        enhanced_query = f"{query} " + " OR ".join(f"site:{d}" for d in domains)
+        return self._get_client().search(
             query=enhanced_query,
             max_results=top_k,
             search_depth="advanced",
-            include_domains=[
-                "amazon.in", "flipkart.com", "myntra.com", "ajio.com",
-                "bigbasket.com", "nykaa.com", "snapdeal.com"
-            ]
+            include_domains=domains
         )
-    except Exception as e:
-        return {"error": str(e)}
+
+
+# Anything with search(query, top_k, domains) -> {"results": [...]} can be
+# plugged in here, e.g. a local stand-in for tests and offline benchmarks.
+_backend = TavilySearchBackend()
+
+
+def get_search_backend():
+    return _backend
+
+
+def set_search_backend(backend):
+    global _backend
+    _backend = backend
+
+
+# ---------------- CACHED SEARCH ----------------
+
+def _fetch(query: str, top_k: int, domains: list) -> dict:
+    with timed("search"):
+        response = _backend.search(query, top_k, domains)
 
     results = []
     for item in response.get("results", []):
@@ -54,3 +90,56 @@ def web_search_tool(input: dict) -> dict:
         "results": results,
         "total_results": len(results)
     }
+
+
+def _refresh_in_background(key: str, fetch):
+    if SEARCH_CACHE.is_refreshing(key):
+        return
+
+    def refresh():
+        try:
+            SEARCH_CACHE.refresh(key, fetch)
+        except Exception:
+            pass  # keep serving the stale entry; the next request retries
+
+    _refresh_pool.submit(refresh)
+
+
+def cached_search(query: str, top_k: int = 10, domains: list = None) -> dict:
+    domains = list(domains or DEFAULT_DOMAINS)
+    key = make_cache_key("search", query, top_k, sorted(domains))
+
+    def fetch():
+        return _fetch(query, top_k, domains)
+
+    entry = SEARCH_CACHE.get_entry(key, max_stale=SEARCH_CACHE_STALE_TTL)
+    if entry is None:
+        return SEARCH_CACHE.refresh(key, fetch)
+    if entry.age > SEARCH_CACHE_TTL:
+        _refresh_in_background(key, fetch)
+    return entry.value
+
+
+@tool
+def web_search_tool(input: dict) -> dict:
+    """
+    Legal web search for Indian e-commerce products.
+
+    Expected input:
+        {
+            "query": "water bottle",
+            "top_k": 10,
+            "domains": [...]          # optional, defaults to the 7 Indian platforms
+        }
+    """
+
+    query = input.get("query", "")
+    top_k = input.get("top_k", 10)
+
+    if not query:
+        return {"error": "Query is missing"}
+
+    try:
+        return cached_search(query, top_k, input.get("domains"))
+    except Exception as e:
+        return {"error": str(e)}
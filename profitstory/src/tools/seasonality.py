@@ -0,0 +1,202 @@
+# src/tools/seasonality.py
+#
+# Day-resolution festival calendar and batch trend scoring. Kept free of
+# LangChain imports so pricing-only workers can build forward price
+# schedules without loading the tool layer.
+#
+# data/festivals.json lists each festival's day per year with a demand
+# window and weight. On first use the windows are flattened into sorted
+# breakpoints (date ordinals) at which the set of active festivals changes:
+# one date is a bisect away, thousands of dates one np.searchsorted. Dates
+# outside the years the file covers fall back to the month table.
+
+import bisect
+import json
+import os
+import threading
+from datetime import date, timedelta
+
+import numpy as np
+
+from .keywords import KeywordMatcher
+
+FESTIVAL_CALENDAR_PATH = os.getenv(
+    "FESTIVAL_CALENDAR_PATH", os.path.join(os.path.dirname(__file__), "data", "festivals.json")
+)
+
+FESTIVAL_BOOST = 25
+SUSTAINABILITY_BOOST = 20
+ARTISAN_BOOST = 10
+MAX_TREND_BOOST = 100
+
+# Month-level fallback for dates the calendar file does not cover
+FESTIVALS_BY_MONTH = {
+    1: [], 2: [], 3: ["Holi"], 4: [], 5: [], 6: [],
+    7: [], 8: ["Raksha Bandhan"], 9: ["Ganesh Chaturthi"],
+    10: ["Dussehra", "Diwali"], 11: ["Diwali"], 12: ["Christmas"]
+}
+# index 0 unused, so months index directly
+_MONTH_WEIGHTS = np.array([0.0] + [1.0 if FESTIVALS_BY_MONTH[m] else 0.0 for m in range(1, 13)])
+
+SUSTAINABILITY_KEYWORDS = ["eco", "organic", "sustainable", "handmade", "natural"]
+ARTISAN_KEYWORDS = ["handmade", "artisan"]
+
+TREND_MATCHER = KeywordMatcher({
+    "sustainability": SUSTAINABILITY_KEYWORDS,
+    "artisan": ARTISAN_KEYWORDS,
+})
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def to_date(value) -> date:
+    """date from a date/datetime or a YYYY-MM-DD string; None means today."""
+    if value is None or value == "":
+        return date.today()
+    if isinstance(value, date):
+        return value if type(value) is date else value.date()
+    return date.fromisoformat(value)
+
+
+class FestivalCalendar:
+    """
+    Active festivals and demand weight for any day, from precomputed
+    segments: festivals[i] and weights[i] hold on [starts[i], starts[i+1]).
+    Overlapping windows (Dussehra inside the Diwali run-up) list both
+    festivals and take the larger weight.
+    """
+
+    def __init__(self, festivals: dict):
+        windows = []
+        for name, spec in festivals.items():
+            for day in spec["dates"]:
+                peak = date.fromisoformat(day).toordinal()
+                windows.append((peak - spec.get("before", 0), peak + spec.get("after", 0), peak, name,
+                                float(spec.get("weight", 1.0))))
+
+        years = [date.fromordinal(w[2]).year for w in windows]
+        self.first = date(min(years), 1, 1).toordinal()
+        self.last = date(max(years), 12, 31).toordinal()
+
+        breakpoints = sorted({self.first} | {w[0] for w in windows} | {w[1] + 1 for w in windows})
+        self.starts = []
+        self.festivals = []
+        weights = []
+        for point in breakpoints:
+            active = sorted((w for w in windows if w[0] <= point <= w[1]), key=lambda w: w[2])
+            self.starts.append(point)
+            self.festivals.append(tuple(dict.fromkeys(w[3] for w in active)))
+            weights.append(max((w[4] for w in active), default=0.0))
+        self.weights = np.array(weights)
+        self._starts = np.array(self.starts, dtype=np.int64)
+
+    @classmethod
+    def load(cls, path: str = FESTIVAL_CALENDAR_PATH) -> "FestivalCalendar":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f)["festivals"])
+
+    def covers(self, day: date) -> bool:
+        return self.first <= day.toordinal() <= self.last
+
+    def _segment(self, ordinal: int) -> int:
+        return bisect.bisect_right(self.starts, ordinal) - 1
+
+    def lookup(self, day) -> tuple:
+        """(festival names, weight) on `day`."""
+        day = to_date(day)
+        if not self.covers(day):
+            names = FESTIVALS_BY_MONTH[day.month]
+            return tuple(names), float(_MONTH_WEIGHTS[day.month])
+        i = self._segment(day.toordinal())
+        return self.festivals[i], float(self.weights[i])
+
+    def between(self, start, end) -> tuple:
+        """(festival names, peak weight) over the days start..end inclusive."""
+        start, end = to_date(start), to_date(end)
+        if not (self.covers(start) and self.covers(end)):
+            # at most one lookup per day, only for ranges leaving the covered years
+            days = [start + timedelta(days=n) for n in range((end - start).days + 1)]
+            found = [self.lookup(day) for day in days]
+        else:
+            lo, hi = self._segment(start.toordinal()), self._segment(end.toordinal())
+            found = [(self.festivals[i], float(self.weights[i])) for i in range(lo, hi + 1)]
+        names = tuple(dict.fromkeys(name for festivals, _ in found for name in festivals))
+        return names, max((weight for _, weight in found), default=0.0)
+
+    def weights_for(self, days) -> np.ndarray:
+        """
+        Demand weight per day; `days` is an array of datetime64[D] (or ISO
+        strings). Missing days (None, "", NaT) mean today, as in to_date().
+        """
+        days = np.array(days, dtype="datetime64[D]")
+        missing = np.isnat(days)
+        if missing.any():
+            days[missing] = np.datetime64(to_date(None), "D")
+        ordinals = days.astype(np.int64) + _EPOCH_ORDINAL
+        segments = np.searchsorted(self._starts, ordinals, side="right") - 1
+        covered = (ordinals >= self.first) & (ordinals <= self.last)
+
+        weights = np.empty(ordinals.shape)
+        weights[covered] = self.weights[segments[covered]]
+        if not covered.all():
+            months = days[~covered].astype("datetime64[M]").astype(np.int64) % 12 + 1
+            weights[~covered] = _MONTH_WEIGHTS[months]
+        return weights
+
+
+_calendar = None
+_calendar_lock = threading.Lock()
+
+
+def get_festival_calendar() -> FestivalCalendar:
+    global _calendar
+    if _calendar is None:
+        with _calendar_lock:
+            if _calendar is None:
+                _calendar = FestivalCalendar.load()
+    return _calendar
+
+
+def set_festival_calendar(calendar: FestivalCalendar):
+    global _calendar
+    with _calendar_lock:
+        _calendar = calendar
+
+
+# ---------------- SCORING ----------------
+
+def festival_boost(weight):
+    """Festival part of the trend boost; works on floats and arrays."""
+    return np.rint(FESTIVAL_BOOST * np.asarray(weight)).astype(np.int64)
+
+
+def category_boost(product_category: str) -> int:
+    hits = TREND_MATCHER.scan(product_category.lower())
+    return (SUSTAINABILITY_BOOST if hits.any("sustainability") else 0) + \
+           (ARTISAN_BOOST if hits.any("artisan") else 0)
+
+
+def _category_boosts(categories) -> np.ndarray:
+    # scan each distinct category once; catalogues repeat them a lot
+    boosts = {category: category_boost(category) for category in set(categories)}
+    return np.array([boosts[category] for category in categories], dtype=np.int64)
+
+
+def trend_scores(categories: list, dates: list) -> np.ndarray:
+    """trend_boost_score for each (category, date) pair, as trend_intelligence_tool computes it."""
+    if len(categories) != len(dates):
+        raise ValueError("categories and dates must have the same length")
+    weights = get_festival_calendar().weights_for(dates)
+    return np.minimum(MAX_TREND_BOOST, _category_boosts(categories) + festival_boost(weights))
+
+
+def trend_schedule(categories: list, start=None, days: int = 90) -> np.ndarray:
+    """
+    Forward trend scores: a (len(categories), days) array whose row i holds
+    the trend_boost_score of categories[i] on start, start + 1, ...
+    """
+    first = np.datetime64(to_date(start), "D")
+    weights = get_festival_calendar().weights_for(first + np.arange(days))
+    return np.minimum(
+        MAX_TREND_BOOST, _category_boosts(categories)[:, None] + festival_boost(weights)[None, :]
+    )
@@ -0,0 +1,207 @@
+# src/tools/sentiment.py
+from concurrent.futures import Future
+from ..observability.metrics import timed
+import os
+import queue
+import threading
+import time
+
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+DEFAULT_BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", "16"))
+MAX_SEQUENCE_LENGTH = 512
+
+MICROBATCH_ENABLED = os.getenv("SENTIMENT_MICROBATCH", "1") != "0"
+MICROBATCH_MAX_SIZE = int(os.getenv("SENTIMENT_MICROBATCH_MAX_SIZE", "64"))
+MICROBATCH_MAX_WAIT_MS = float(os.getenv("SENTIMENT_MICROBATCH_MAX_WAIT_MS", "10"))
+
+
+class SentimentModelManager:
+    """
+    Owns the sentiment-analysis pipeline for the whole process.
+
+    The model is loaded on first use (transformers/torch are imported lazily)
+    and reused by every later call. Scoring goes through the pipeline in
+    batches; the tokenizer truncates long reviews to the model's limit.
+    """
+
+    def __init__(self, model: str = SENTIMENT_MODEL):
+        self.model = model
+        self._pipeline = None
+        self._load_lock = threading.Lock()
+        self._infer_lock = threading.Lock()
+
+    def get_pipeline(self):
+        if self._pipeline is None:
+            with self._load_lock:
+                if self._pipeline is None:
+                    from transformers import pipeline
+                    self._pipeline = pipeline("sentiment-analysis", model=self.model)
+        return self._pipeline
+
+    def set_pipeline(self, sentiment_pipeline):
+        """Swap in a preloaded or stand-in pipeline (anything callable like a HF pipeline)."""
+        with self._load_lock:
+            self._pipeline = sentiment_pipeline
+
+    def score(self, texts: list, batch_size: int = None) -> list:
+        """Return 1.0 / 0.0 per text for POSITIVE / NEGATIVE, in input order."""
+        texts = [str(t) for t in texts]
+        if not texts:
+            return []
+
+        sentiment_pipeline = self.get_pipeline()
+        with self._infer_lock, timed("sentiment_inference"):
+            results = sentiment_pipeline(
+                texts,
+                batch_size=batch_size or DEFAULT_BATCH_SIZE,
+                truncation=True,
+                max_length=MAX_SEQUENCE_LENGTH
+            )
+
+        return [1.0 if r["label"] == "POSITIVE" else 0.0 for r in results]
+
+
+class SentimentBatcher:
+    """
+    In-process inference service that coalesces review texts from concurrent
+    callers into shared forward passes.
+
+    Callers enqueue texts and block on per-text futures. A single worker
+    thread drains the queue and flushes a batch when it reaches
+    max_batch_size or when the oldest queued text has waited max_wait_ms,
+    then routes each score back to its caller's future. A caller's
+    batch_size caps the forward-pass size of any flush holding its texts.
+    """
+
+    def __init__(self, manager: SentimentModelManager,
+                 max_batch_size: int = MICROBATCH_MAX_SIZE,
+                 max_wait_ms: float = MICROBATCH_MAX_WAIT_MS):
+        self.manager = manager
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._worker = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._texts = 0
+        self._max_batch_seen = 0
+        self._last_batch_size = 0
+        self._flushes_by_size = 0
+        self._flushes_by_wait = 0
+        self._batch_size_histogram = {}
+
+    def _ensure_worker(self):
+        if self._worker is None:
+            with self._start_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._run, name="sentiment-batcher", daemon=True
+                    )
+                    self._worker.start()
+
+    def submit(self, texts: list, batch_size: int = None) -> list:
+        """Enqueue texts and return one Future per text."""
+        self._ensure_worker()
+        futures = []
+        for text in texts:
+            future = Future()
+            self._queue.put((str(text), future, batch_size))
+            futures.append(future)
+        return futures
+
+    def score(self, texts: list, timeout: float = None, batch_size: int = None) -> list:
+        return [f.result(timeout=timeout) for f in self.submit(texts, batch_size)]
+
+    def _collect_batch(self) -> tuple:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch, len(batch) >= self.max_batch_size
+
+    def _run(self):
+        while True:
+            batch, full = self._collect_batch()
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            # the smallest batch_size any caller in this flush asked for
+            pass_size = min((size for _, _, size in batch if size), default=self.max_batch_size)
+            try:
+                scores = self.manager.score(
+                    [text for text, _, _ in batch], batch_size=pass_size
+                )
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+            else:
+                for (_, future, _), value in zip(batch, scores):
+                    future.set_result(value)
+
+            self._record_flush(len(batch), full)
+
+    def _record_flush(self, size: int, full: bool):
+        with self._stats_lock:
+            self._batches += 1
+            self._texts += size
+            self._last_batch_size = size
+            self._max_batch_seen = max(self._max_batch_seen, size)
+            if full:
+                self._flushes_by_size += 1
+            else:
+                self._flushes_by_wait += 1
+            bucket = 1
+            while bucket < size:
+                bucket *= 2
+            self._batch_size_histogram[bucket] = self._batch_size_histogram.get(bucket, 0) + 1
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "batches_flushed": self._batches,
+                "texts_scored": self._texts,
+                "avg_batch_size": round(self._texts / self._batches, 2) if self._batches else 0,
+                "max_batch_size_seen": self._max_batch_seen,
+                "last_batch_size": self._last_batch_size,
+                "flushes_by_size": self._flushes_by_size,
+                "flushes_by_wait": self._flushes_by_wait,
+                # batch sizes bucketed to the next power of two
+                "batch_size_histogram": dict(sorted(self._batch_size_histogram.items())),
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000
+            }
+
+
+_MANAGER = SentimentModelManager()
+_BATCHER = SentimentBatcher(_MANAGER)
+
+
+def get_sentiment_manager() -> SentimentModelManager:
+    return _MANAGER
+
+
+def get_sentiment_batcher() -> SentimentBatcher:
+    return _BATCHER
+
+
+def score_sentiments(texts: list, batch_size: int = None) -> list:
+    """
+    Score texts with the shared model. With micro-batching on (the default),
+    texts are pooled with those of concurrent callers; otherwise this caller
+    runs its own batched pass. Either way batch_size caps the forward-pass
+    size.
+    """
+    if MICROBATCH_ENABLED:
+        return _BATCHER.score(texts, batch_size=batch_size)
+    return _MANAGER.score(texts, batch_size=batch_size)
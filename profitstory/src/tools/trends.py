@@ -1,8 +1,12 @@
 # src/tools/trends.py
 from langchain_core.tools import tool
-from datetime import datetime
+from .seasonality import (
+    TREND_MATCHER, SUSTAINABILITY_BOOST, ARTISAN_BOOST, MAX_TREND_BOOST,
+    get_festival_calendar, festival_boost, to_date
+)
 import calendar
 
+
 @tool
 def trend_intelligence_tool(input: dict) -> dict:
     """
@@ -16,47 +20,40 @@ def trend_intelligence_tool(input: dict) -> dict:
     """
 
     product_category = input.get("product_category", "").lower()
-    current_date = input.get("current_date")
-
-    if not current_date:
-        current_date = datetime.now().strftime("%Y-%m-%d")
-
-    date_obj = datetime.strptime(current_date, "%Y-%m-%d")
+    date_obj = to_date(input.get("current_date"))
     month = date_obj.month
 
-    # Indian festival calendar
-    festivals = {
-        1: [], 2: [], 3: ["Holi"], 4: [], 5: [], 6: [],
-        7: [], 8: ["Raksha Bandhan"], 9: ["Ganesh Chaturthi"],
-        10: ["Dussehra", "Diwali"], 11: ["Diwali"], 12: ["Christmas"]
-    }
+    # Festival windows for the exact day (month table outside the calendar's years)
+    festivals, festival_weight = get_festival_calendar().lookup(date_obj)
 
     trends_detected = []
     trend_boost_score = 0
+    hits = TREND_MATCHER.scan(product_category)
+    is_sustainable = hits.any("sustainability")
 
     # FESTIVAL BOOST
-    if festivals.get(month):
-        trends_detected.append(f"Festival Season: {', '.join(festivals[month])}")
-        trend_boost_score += 25
+    if festivals:
+        trends_detected.append(f"Festival Season: {', '.join(festivals)}")
+        trend_boost_score += int(festival_boost(festival_weight))
 
     # SUSTAINABILITY TREND
-    sustainability_keywords = ["eco", "organic", "sustainable", "handmade", "natural"]
-    if any(k in product_category for k in sustainability_keywords):
+    if is_sustainable:
         trends_detected.append("Sustainability Demand Rising")
-        trend_boost_score += 20
+        trend_boost_score += SUSTAINABILITY_BOOST
 
     # VIRAL TRENDS
     viral_indicators = []
-    if "handmade" in product_category or "artisan" in product_category:
+    if hits.any("artisan"):
         viral_indicators.append("Support for Local Artisans Movement")
-        trend_boost_score += 10
+        trend_boost_score += ARTISAN_BOOST
 
     return {
         "trends_detected": trends_detected,
-        "trend_boost_score": min(100, trend_boost_score),
+        "trend_boost_score": min(MAX_TREND_BOOST, trend_boost_score),
         "seasonal_factors": {
             "current_month": calendar.month_name[month],
-            "festivals": festivals.get(month, []),
+            "festivals": list(festivals),
+            "festival_weight": festival_weight,
             "is_peak_season": trend_boost_score > 30
         },
         "viral_indicators": viral_indicators,
@@ -66,6 +63,6 @@ def trend_intelligence_tool(input: dict) -> dict:
             "normal"
         ),
         "sustainability_trend": (
-            75.0 if any(k in product_category for k in sustainability_keywords) else 45.0
+            75.0 if is_sustainable else 45.0
         )
     }
@@ -0,0 +1,31 @@
+# tests/test_bulk.py
+
+import json
+
+from src.cli import bulk
+
+
+def test_malformed_jsonl_rows_are_skipped(tmp_path, monkeypatch, capsys):
+    catalogue = tmp_path / "catalogue.jsonl"
+    catalogue.write_text(
+        json.dumps({"id": "a", "name": "Brass lamp", "price": 1200}) + "\n"
+        + '{"id": "b", "name": "Silk sto\n'
+        + "[1, 2]\n"
+        + json.dumps({"id": "c", "name": "Jute bag", "price": "350"}) + "\n",
+        encoding="utf-8",
+    )
+    output = tmp_path / "priced.jsonl"
+
+    monkeypatch.setattr(bulk, "get_pricing_agent", lambda durable=False: None)
+    monkeypatch.setattr(bulk, "price_product", lambda agent, product, current_date, cancel_event: {
+        "id": product[0], "status": "ok", "result": {"name": product[1]},
+    })
+
+    counts = bulk.run_bulk(bulk.read_products(str(catalogue), "id"), str(output), concurrency=2)
+
+    assert counts == {"ok": 2, "error": 0, "skipped": 2}
+    priced = {json.loads(line)["id"] for line in output.read_text(encoding="utf-8").splitlines()}
+    assert priced == {"a", "c"}
+    stderr = capsys.readouterr().err
+    assert "skipping row 2: bad JSON" in stderr
+    assert "skipping row 3: not an object" in stderr